@@ -0,0 +1,61 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
+from users.authentication import CachedJWTAuthentication, token_cache, user_cache
+
+
+@pytest.fixture(autouse=True)
+def clean_caches():
+    token_cache.clear()
+    user_cache.clear()
+
+
+def authenticate(user):
+    request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+    return CachedJWTAuthentication().authenticate(request)
+
+
+@pytest.mark.django_db
+def test_repeat_requests_skip_user_lookup(django_assert_num_queries):
+    user = get_user_model().objects.create_user(email="buyer@example.com", password="password123")
+    request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+    auth = CachedJWTAuthentication()
+
+    with django_assert_num_queries(1):
+        first, _ = auth.authenticate(request)
+    with django_assert_num_queries(0):
+        second, _ = auth.authenticate(request)
+
+    assert first.pk == second.pk == user.pk
+    assert second.email == "buyer@example.com"
+
+
+@pytest.mark.django_db
+def test_deactivated_user_is_rejected(django_capture_on_commit_callbacks):
+    user = get_user_model().objects.create_user(email="buyer@example.com", password="password123")
+    authenticate(user)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        user.is_active = False
+        user.save()
+
+    with pytest.raises(AuthenticationFailed):
+        authenticate(user)
+
+
+@pytest.mark.django_db
+def test_snapshot_keeps_superuser_and_model_permissions():
+    User = get_user_model()
+    admin, _ = authenticate(User.objects.create_superuser(email="admin@example.com", password="password123"))
+    assert admin.is_superuser
+    assert admin.has_perm("products.delete_product")
+
+    user = User.objects.create_user(email="buyer@example.com", password="password123")
+    user.user_permissions.add(Permission.objects.get(content_type__app_label="products", codename="change_product"))
+    buyer, _ = authenticate(user)
+    assert not buyer.is_superuser
+    assert buyer.has_perms(["products.change_product"])
+    assert not buyer.has_perm("products.delete_product")
@@ -0,0 +1,69 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.urls import reverse
+from django.test import RequestFactory
+from rest_framework.test import APIClient
+from users import hashers
+from users.hashers import HashingOverloaded, HashingOverloadedMiddleware, PooledPBKDF2PasswordHasher, shutdown_pool
+
+
+@pytest.fixture
+def pooled(settings):
+    settings.PASSWORD_HASHING_WORKERS = 1
+    yield
+    shutdown_pool()
+
+
+def test_pooled_hasher_matches_inline_hashes(pooled):
+    hasher = PooledPBKDF2PasswordHasher()
+    encoded = hasher.encode("TestPass123", "fixedsalt")
+    assert encoded == make_password("TestPass123", "fixedsalt", hasher="pbkdf2_sha256")
+    assert hasher.verify("TestPass123", encoded)
+    assert not hasher.verify("wrong", encoded)
+
+
+@pytest.mark.django_db
+def test_login_upgrades_legacy_hash_to_argon2(settings):
+    settings.PASSWORD_HASHING_WORKERS = 0
+    user = get_user_model().objects.create_user(email="legacy@example.com")
+    user.password = make_password("TestPass123", hasher="pbkdf2_sha256")
+    user.save()
+
+    response = APIClient().post(
+        reverse("login"), {"email": "legacy@example.com", "password": "TestPass123"}, format="json"
+    )
+    assert response.status_code == 200
+    user.refresh_from_db()
+    assert user.password.startswith("argon2")
+
+
+def test_overload_is_a_503_outside_drf():
+    middleware = HashingOverloadedMiddleware(lambda request: None)
+    response = middleware.process_exception(RequestFactory().post("/admin/login/"), HashingOverloaded())
+    assert response.status_code == 503
+    assert response["Retry-After"]
+
+
+@pytest.mark.django_db
+def test_login_gets_503_once_the_pool_queue_is_full(pooled, settings):
+    settings.PASSWORD_HASHING_QUEUE = 1
+    settings.PASSWORD_HASHING_QUEUE_TIMEOUT = 0.1
+    get_user_model().objects.create_user(email="buyer@example.com", password="TestPass123")
+
+    # Every slot taken by jobs from other threads of this worker
+    hashers._get_pool()
+    held = 0
+    while hashers._slots.acquire(blocking=False):
+        held += 1
+    assert held == settings.PASSWORD_HASHING_WORKERS * settings.PASSWORD_HASHING_QUEUE
+    try:
+        with pytest.raises(HashingOverloaded):
+            PooledPBKDF2PasswordHasher().encode("TestPass123", "fixedsalt")
+        response = APIClient().post(
+            reverse("login"), {"email": "buyer@example.com", "password": "TestPass123"}, format="json"
+        )
+        assert response.status_code == 503
+    finally:
+        for _ in range(held):
+            hashers._slots.release()
@@ -0,0 +1,78 @@
+import smtplib
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.urls import reverse
+from rest_framework.test import APIClient
+from users.models import Profile
+from users import tasks
+from users.tasks import handle_registration, send_welcome_emails
+
+
+@pytest.fixture(autouse=True)
+def locmem_email(settings):
+    settings.EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+
+
+@pytest.mark.django_db
+def test_register_defers_side_effects_until_commit(django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=False) as callbacks:
+        response = APIClient().post(
+            reverse("register"), {"email": "new@example.com", "password": "TestPass123"}, format="json"
+        )
+    assert response.status_code == 201
+    assert len(callbacks) == 1
+    assert not Profile.objects.exists()
+    assert mail.outbox == []
+
+
+@pytest.mark.django_db
+def test_welcome_emails_are_batched_and_sent_once():
+    users = [
+        get_user_model().objects.create_user(email=f"user{i}@example.com", password="TestPass123")
+        for i in range(5)
+    ]
+    for user in users:
+        handle_registration(user.id)
+        handle_registration(user.id)  # retried task: still one profile
+    assert Profile.objects.count() == 5
+
+    assert send_welcome_emails(batch_size=2) == 5
+    assert sorted(message.to[0] for message in mail.outbox) == sorted(user.email for user in users)
+    assert not Profile.objects.filter(welcome_email_sent_at__isnull=True).exists()
+
+    assert send_welcome_emails() == 0
+    assert len(mail.outbox) == 5
+
+
+class FailingAfter(EmailBackend):
+    def __init__(self, accepted, **kwargs):
+        super().__init__(**kwargs)
+        self.accepted = accepted
+
+    def send_messages(self, messages):
+        if len(mail.outbox) >= self.accepted:
+            raise smtplib.SMTPServerDisconnected("connection lost")
+        return super().send_messages(messages)
+
+
+@pytest.mark.django_db
+def test_welcome_emails_accepted_before_an_smtp_failure_are_not_resent(monkeypatch):
+    users = [
+        get_user_model().objects.create_user(email=f"user{i}@example.com", password="TestPass123")
+        for i in range(5)
+    ]
+    for user in users:
+        handle_registration(user.id)
+
+    monkeypatch.setattr(tasks, "get_connection", lambda: FailingAfter(accepted=2))
+    with pytest.raises(smtplib.SMTPServerDisconnected):
+        send_welcome_emails(batch_size=5)
+    assert len(mail.outbox) == 2
+    assert Profile.objects.filter(welcome_email_sent_at__isnull=False).count() == 2
+
+    monkeypatch.undo()
+    assert send_welcome_emails() == 3
+    assert sorted(message.to[0] for message in mail.outbox) == sorted(user.email for user in users)
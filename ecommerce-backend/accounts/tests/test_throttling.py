@@ -0,0 +1,39 @@
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+from users import throttling
+
+
+@pytest.fixture(autouse=True)
+def local_buckets(settings, monkeypatch):
+    settings.THROTTLE_REDIS_URL = ""
+    settings.PASSWORD_HASHING_WORKERS = 0
+    monkeypatch.setattr(throttling, "_store", None)
+    throttling.leases.clear()
+
+
+def login(client, email, ip):
+    return client.post(
+        reverse("login"), {"email": email, "password": "wrong"}, format="json", REMOTE_ADDR=ip
+    )
+
+
+@pytest.mark.django_db
+def test_login_is_throttled_per_email_across_ips():
+    client = APIClient()
+    statuses = [login(client, "victim@example.com", f"10.0.0.{i}").status_code for i in range(6)]
+    assert statuses[:5] == [401] * 5
+    assert statuses[5] == 429
+
+    # Another account from the same IPs is unaffected
+    assert login(client, "other@example.com", "10.0.0.1").status_code == 401
+
+
+def test_bucket_leases_never_exceed_capacity():
+    store = throttling.LocalBucketStore()
+    granted = [store.take("k", 20, 20 / 60, 2)[0] for _ in range(30)]
+    assert sum(granted) == 20
+    # Batches while at least half full, then one token at a time
+    assert granted[:6] == [2] * 6
+    assert granted[6:14] == [1] * 8
+    assert store.take("k", 20, 20 / 60, 2)[1] > 0
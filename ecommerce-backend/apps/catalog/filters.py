@@ -1,4 +1,5 @@
 from django_filters import rest_framework as filters
+from categories.models import Category
 from .models import Product
 
 class ProductFilter(filters.FilterSet):
@@ -9,6 +10,17 @@ class ProductFilter(filters.FilterSet):
     # Filter by category name instead of just ID
     category_name = filters.CharFilter(field_name="category__name", lookup_expr='icontains')
 
+    # A category and everything below it: one prefix scan on the materialized path
+    category_tree = filters.NumberFilter(method='filter_category_tree')
+
     class Meta:
         model = Product
-        fields = ['category', 'min_price', 'max_price', 'category_name']
+        fields = ['category', 'min_price', 'max_price', 'category_name', 'category_tree']
+
+    def filter_category_tree(self, queryset, name, value):
+        # A literal prefix, not a subquery: only LIKE 'prefix%' can use the
+        # varchar_pattern_ops index as a range scan
+        path = Category.objects.filter(pk=value).values_list('path', flat=True).first()
+        if path is None:
+            return queryset.none()
+        return queryset.filter(category__path__startswith=path)
@@ -0,0 +1,135 @@
+import itertools
+import math
+import random
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.utils.text import slugify
+from categories.models import Category
+from products.models import Product
+from core.cache import bump_generation
+from products.counters import reconcile_category_counters
+
+ADJECTIVES = [
+    'Classic', 'Compact', 'Deluxe', 'Essential', 'Premium', 'Portable', 'Smart', 'Vintage',
+    'Wireless', 'Ergonomic', 'Rugged', 'Slim', 'Eco', 'Pro', 'Ultra', 'Everyday',
+]
+MATERIALS = [
+    'Bamboo', 'Carbon', 'Ceramic', 'Cotton', 'Leather', 'Linen', 'Oak', 'Steel',
+    'Titanium', 'Wool', 'Glass', 'Aluminium', 'Silicone', 'Walnut', 'Canvas', 'Nylon',
+]
+NOUNS = [
+    'Backpack', 'Blender', 'Chair', 'Headphones', 'Jacket', 'Kettle', 'Lamp', 'Notebook',
+    'Speaker', 'Sneakers', 'Tent', 'Watch', 'Wallet', 'Keyboard', 'Mug', 'Drill',
+]
+SENTENCES = [
+    'Built from {material} for years of daily use.',
+    'A {adjective} take on the {noun} that fits any routine.',
+    'Designed and tested by people who use a {noun} every day.',
+    'Ships with a two-year warranty and free returns.',
+    'Lightweight, easy to clean and made to last.',
+    'Our best-selling {noun}, now in {material}.',
+]
+DEPARTMENTS = [
+    'Electronics', 'Fashion', 'Home & Garden', 'Books', 'Sports', 'Toys', 'Beauty', 'Automotive',
+]
+
+
+class Command(BaseCommand):
+    help = 'Generates a large synthetic catalog (category tree + products) for load testing'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--categories', type=int, default=100)
+        parser.add_argument('--depth', type=int, default=3, help='Levels in the category tree')
+        parser.add_argument('--products', type=int, default=100_000)
+        parser.add_argument('--batch-size', type=int, default=10_000)
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--prefix', default='gen', help='Category name/slug prefix so runs never collide')
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        started = time.monotonic()
+
+        categories, leaves = self.create_categories(rng, options)
+        self.stdout.write(f'{len(categories)} categories ({len(leaves)} leaves)')
+
+        # Zipf-like popularity: a few categories hold most of the products
+        weights = [1 / (rank ** 1.1) for rank in range(1, len(leaves) + 1)]
+        rng.shuffle(leaves)
+        cum_weights = list(itertools.accumulate(weights))
+
+        total = options['products']
+        batch_size = options['batch_size']
+        created = 0
+        while created < total:
+            size = min(batch_size, total - created)
+            chosen = rng.choices(leaves, cum_weights=cum_weights, k=size)
+            batch = [
+                self.build_product(rng, created + i, category)
+                for i, category in enumerate(chosen)
+            ]
+            Product.objects.bulk_create(batch, batch_size=batch_size)
+            created += size
+            elapsed = max(time.monotonic() - started, 1e-9)
+            self.stdout.write(f'{created}/{total} products ({created / elapsed:.0f} rows/s)')
+
+        # bulk_create skips model signals: refresh counters, invalidate listings
+        reconcile_category_counters()
+        bump_generation('products', 'categories')
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'Generated {len(categories)} Categories and {created} Products in {elapsed:.1f}s'
+        ))
+
+    def create_categories(self, rng, options):
+        count, depth, prefix = options['categories'], max(options['depth'], 1), options['prefix']
+        # Spread categories over the levels, wider towards the leaves
+        roots = min(count, len(DEPARTMENTS)) if depth > 1 else count
+        levels = [roots]
+        remaining = count - roots
+        for level in range(1, depth):
+            share = remaining if level == depth - 1 else math.ceil(remaining / (depth - level) * 0.6)
+            levels.append(share)
+            remaining -= share
+
+        categories, parents, leaves = [], [], []
+        for level, size in enumerate(levels):
+            current = []
+            for i in range(size):
+                parent = rng.choice(parents) if parents else None
+                base = DEPARTMENTS[i % len(DEPARTMENTS)] if parent is None else rng.choice(NOUNS) + 's'
+                name = f'{base} {prefix}-{level}-{i}'
+                current.append(Category(name=name, slug=slugify(name), parent=parent))
+            Category.objects.bulk_create(current, batch_size=options['batch_size'])
+            # Reload to get primary keys on databases without RETURNING
+            by_id = {c.pk: c for c in parents}
+            current = list(Category.objects.filter(slug__in=[c.slug for c in current]))
+            # bulk_create skips save(), so fill in the materialized paths here
+            for category in current:
+                category.path = Category.build_path(by_id.get(category.parent_id), category.pk)
+                category.depth = level
+            Category.objects.bulk_update(current, ['path', 'depth'], batch_size=options['batch_size'])
+            categories += current
+            if level == len(levels) - 1:
+                leaves = current
+            parents = current
+        return categories, list(leaves or categories)
+
+    def build_product(self, rng, n, category):
+        adjective, material, noun = rng.choice(ADJECTIVES), rng.choice(MATERIALS), rng.choice(NOUNS)
+        name = f'{adjective} {material} {noun} {n:07d}'
+        words = {'adjective': adjective.lower(), 'material': material.lower(), 'noun': noun.lower()}
+        description = ' '.join(s.format(**words) for s in rng.sample(SENTENCES, rng.randint(2, 4)))
+        # Log-normal prices (median ~$33, long tail) and stock where ~10% is sold out
+        price = min(rng.lognormvariate(3.5, 1.0), 99_999.0)
+        stock = 0 if rng.random() < 0.1 else int(rng.paretovariate(1.2) * 5)
+        return Product(
+            category=category,
+            name=name,
+            description=description,
+            price=Decimal(f'{price:.2f}'),
+            stock=min(stock, 100_000),
+            is_active=rng.random() > 0.05,
+        )
@@ -0,0 +1,217 @@
+import csv
+import gzip
+import io
+import json
+import time
+from decimal import Decimal, InvalidOperation
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils.text import slugify
+from categories.models import Category
+from products.models import Product
+from core.cache import bump_generation
+from products.counters import reconcile_category_counters
+
+# Columns loaded from the feed, in staging-table order
+COLUMNS = ['name', 'slug', 'description', 'price', 'stock', 'is_active', 'category_id']
+TRUE_VALUES = {'1', 'true', 't', 'yes', 'y'}
+FALSE_VALUES = {'0', 'false', 'f', 'no', 'n', ''}
+
+
+class Command(BaseCommand):
+    help = 'Streams a CSV/JSONL product feed into the catalog (COPY + upsert on slug)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Feed file (.csv, .jsonl, optionally .gz)')
+        parser.add_argument('--format', choices=['csv', 'jsonl'], help='Defaults to the file extension')
+        parser.add_argument('--chunk-size', type=int, default=10000)
+        parser.add_argument('--rejects', help='Where rejected rows go (default: <path>.rejects.jsonl)')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        fmt = options['format'] or ('jsonl' if '.jsonl' in path or '.ndjson' in path else 'csv')
+        chunk_size = options['chunk_size']
+        rejects_path = options['rejects'] or f'{path}.rejects.jsonl'
+
+        # One query for the whole run instead of one per row
+        self.categories = dict(Category.objects.values_list('slug', 'id'))
+        self.use_copy = connection.vendor == 'postgresql'
+
+        loaded = rejected = 0
+        touched_categories = set()
+        started = time.monotonic()
+
+        with self.open_feed(path) as feed, open(rejects_path, 'w') as rejects:
+            for chunk in self.chunks(self.read_rows(feed, fmt), chunk_size):
+                valid = []
+                for line, raw in chunk:
+                    row, errors = self.validate(raw)
+                    if errors:
+                        rejected += 1
+                        rejects.write(json.dumps({'line': line, 'row': raw, 'errors': errors}) + '\n')
+                    else:
+                        valid.append(row)
+
+                # Later rows win when a slug repeats inside one chunk
+                valid = list({row['slug']: row for row in valid}.values())
+                if valid:
+                    self.load(valid)
+                loaded += len(valid)
+                touched_categories.update(row['category_id'] for row in valid)
+
+                elapsed = max(time.monotonic() - started, 1e-9)
+                self.stdout.write(f'{loaded} rows loaded, {rejected} rejected ({loaded / elapsed:.0f} rows/s)')
+
+        # COPY and bulk upserts skip model signals: refresh counters, invalidate listings
+        reconcile_category_counters(touched_categories)
+        bump_generation('products', 'categories', *(f'products:category:{pk}' for pk in touched_categories))
+
+        elapsed = max(time.monotonic() - started, 1e-9)
+        self.stdout.write(self.style.SUCCESS(
+            f'Imported {loaded} products in {elapsed:.1f}s ({loaded / elapsed:.0f} rows/s)'
+        ))
+        if rejected:
+            self.stdout.write(self.style.WARNING(f'{rejected} rows rejected, see {rejects_path}'))
+
+    def open_feed(self, path):
+        try:
+            if path.endswith('.gz'):
+                return gzip.open(path, 'rt', newline='')
+            return open(path, newline='')
+        except OSError as exc:
+            raise CommandError(f'Cannot open {path}: {exc}')
+
+    def read_rows(self, feed, fmt):
+        if fmt == 'csv':
+            # Header is line 1
+            for line, raw in enumerate(csv.DictReader(feed), start=2):
+                yield line, raw
+            return
+        for line, text in enumerate(feed, start=1):
+            if not text.strip():
+                continue
+            try:
+                yield line, json.loads(text)
+            except ValueError:
+                yield line, {'_raw': text.rstrip('\n')}
+
+    def chunks(self, rows, size):
+        chunk = []
+        for item in rows:
+            chunk.append(item)
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def validate(self, raw):
+        # A JSONL line can hold any JSON value, e.g. [] or "x"
+        if not isinstance(raw, dict):
+            return None, ['row is not a JSON object']
+
+        errors = []
+        name = str(raw.get('name') or '').strip()
+        if not name:
+            errors.append('name is required')
+        slug = slugify(raw.get('slug') or name)[:255]
+
+        try:
+            price = Decimal(str(raw.get('price'))).quantize(Decimal('0.01'))
+            if price < 0 or price >= Decimal('1e8'):
+                errors.append('price out of range')
+        except (InvalidOperation, ValueError):
+            price = None
+            errors.append('price is not a number')
+
+        try:
+            stock = int(raw.get('stock') or 0)
+            if stock < 0:
+                errors.append('stock must be positive')
+        except (TypeError, ValueError):
+            stock = None
+            errors.append('stock is not an integer')
+
+        is_active = str(raw.get('is_active', 'true')).strip().lower()
+        if is_active not in TRUE_VALUES | FALSE_VALUES:
+            errors.append('is_active is not a boolean')
+
+        category_id = self.categories.get(raw.get('category'))
+        if category_id is None:
+            errors.append(f"unknown category {raw.get('category')!r}")
+
+        row = {
+            'name': name[:255],
+            'slug': slug,
+            'description': str(raw.get('description') or ''),
+            'price': price,
+            'stock': stock,
+            'is_active': is_active in TRUE_VALUES,
+            'category_id': category_id,
+        }
+        return row, errors
+
+    def load(self, rows):
+        if self.use_copy:
+            self.copy_upsert(rows)
+        else:
+            self.bulk_upsert(rows)
+
+    def create_staging_table(self, cursor):
+        # Created in the chunk's own transaction and dropped at its commit:
+        # behind PgBouncer (transaction pooling) the next transaction may
+        # run on another server connection, which would not see a session
+        # temp table. IF NOT EXISTS + TRUNCATE cover an outer atomic block.
+        cursor.execute(
+            'CREATE TEMP TABLE IF NOT EXISTS product_import_staging ('
+            ' name text, slug text, description text, price numeric(10, 2),'
+            ' stock integer, is_active boolean, category_id bigint)'
+            ' ON COMMIT DROP'
+        )
+        cursor.execute('TRUNCATE product_import_staging')
+
+    def copy_upsert(self, rows):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow([row[column] for column in COLUMNS])
+        buffer.seek(0)
+
+        table = Product._meta.db_table
+        field_names = {field.name for field in Product._meta.concrete_fields}
+        insert_columns = list(COLUMNS)
+        select_columns = list(COLUMNS)
+        update_columns = [f'{column} = EXCLUDED.{column}' for column in COLUMNS if column != 'slug']
+        # Django defaults live in Python, not in the table: spell them out
+        for column, value in (('created_at', 'now()'), ('updated_at', 'now()'), ('shard_count', '0')):
+            if column in field_names:
+                insert_columns.append(column)
+                select_columns.append(value)
+        if 'updated_at' in field_names:
+            update_columns.append('updated_at = now()')
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            self.create_staging_table(cursor)
+            copy_sql = f"COPY product_import_staging ({', '.join(COLUMNS)}) FROM STDIN WITH (FORMAT csv)"
+            raw = cursor.cursor
+            if hasattr(raw, 'copy_expert'):  # psycopg2
+                raw.copy_expert(copy_sql, buffer)
+            else:  # psycopg 3
+                with raw.copy(copy_sql) as copy:
+                    copy.write(buffer.getvalue())
+            cursor.execute(
+                f"INSERT INTO {table} ({', '.join(insert_columns)}) "
+                f"SELECT {', '.join(select_columns)} FROM product_import_staging "
+                f"ON CONFLICT (slug) DO UPDATE SET {', '.join(update_columns)}"
+            )
+
+    def bulk_upsert(self, rows):
+        # Non-PostgreSQL databases (e.g. SQLite in tests): same upsert through the ORM
+        with transaction.atomic():
+            Product.objects.bulk_create(
+                [Product(**row) for row in rows],
+                update_conflicts=True,
+                unique_fields=['slug'],
+                update_fields=[column for column in COLUMNS if column != 'slug'],
+            )
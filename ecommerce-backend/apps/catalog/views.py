@@ -2,6 +2,7 @@ from rest_framework import generics
 from .models import Product
 from .serializers import ProductSerializer
 from .filters import ProductFilter
+from products.pagination import ProductPagination, SelectablePaginationMixin
 
 class ProductListView(generics.ListAPIView):
     # Optimization: select_related fetches the Category in the same SQL join
@@ -30,7 +31,10 @@ git push origin main
 
 from drf_spectacular.utils import extend_schema
 
-class ProductListView(generics.ListAPIView):
+class ProductListView(SelectablePaginationMixin, generics.ListAPIView):
+    # Page numbers for the storefront, ?pagination=cursor for deep crawls
+    pagination_class = ProductPagination
+
     # This tag groups the endpoint in Swagger
     @extend_schema(tags=['Products'], summary="List all active products with filters")
     def get(self, request, *args, **kwargs):
@@ -0,0 +1,12 @@
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
+
+from .models import Category
+from .serializers import CategorySerializer
+
+
+@require_GET
+async def category_list(request):
+    # Async (ASGI) counterpart of CategoryViewSet.list
+    categories = [category async for category in Category.objects.all()]
+    return JsonResponse(CategorySerializer(categories, many=True).data, safe=False)
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models import F, Value
+from django.db.models.functions import Concat, Now, Substr
 from django.utils.text import slugify
 
 class BaseModel(models.Model):
@@ -49,5 +51,63 @@ class Category(models.Model):
     name = models.CharField(max_length=100, unique=True, db_index=True)
     slug = models.SlugField(unique=True, db_index=True)
 
+    # Materialized path: every ancestor's zero-padded id, e.g. "0000000001/0000000007/".
+    # A subtree is one indexed prefix (range) scan: path LIKE 'ancestor/path/%'
+    parent = models.ForeignKey("self", null=True, blank=True, related_name="children", on_delete=models.CASCADE)
+    path = models.CharField(max_length=255, blank=True, editable=False)
+    depth = models.PositiveSmallIntegerField(default=0, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    # Denormalized from active products; kept current by products.counters
+    active_product_count = models.PositiveIntegerField(default=0)
+    min_price = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+    max_price = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+
+    class Meta:
+        verbose_name_plural = "Categories"
+        indexes = [
+            models.Index(fields=["path"], name="category_path_idx", opclasses=["varchar_pattern_ops"]),
+        ]
+
+    def __str__(self):
+        return self.name
+
+    @staticmethod
+    def build_path(parent, pk):
+        return f"{parent.path if parent else ''}{pk:010d}/"
+
+    @property
+    def ancestor_ids(self):
+        return [int(segment) for segment in self.path.split("/") if segment]
+
+    def save(self, *args, **kwargs):
+        if self.parent_id and self.pk and self.pk in self.parent.ancestor_ids:
+            raise ValueError("A category cannot be moved under its own subtree")
+
+        old_path = self.path
+        super().save(*args, **kwargs)
+
+        new_path = self.build_path(self.parent, self.pk)
+        if new_path == old_path:
+            return
+        new_depth = new_path.count("/") - 1
+        if old_path:
+            # Moved: rewrite the whole subtree in one UPDATE, no recursion
+            Category.objects.filter(path__startswith=old_path).exclude(pk=self.pk).update(
+                path=Concat(Value(new_path), Substr("path", len(old_path) + 1)),
+                depth=F("depth") + (new_depth - self.depth),
+                updated_at=Now(),
+            )
+        Category.objects.filter(pk=self.pk).update(path=new_path, depth=new_depth)
+        self.path, self.depth = new_path, new_depth
+
+    def subtree(self):
+        """This category and all of its descendants."""
+        return Category.objects.filter(path__startswith=self.path)
+
+    def ancestors(self):
+        """Root first, ending with this category (breadcrumbs)."""
+        return Category.objects.filter(pk__in=self.ancestor_ids).order_by("depth")
+
 docker-compose run backend python src/manage.py makemigrations
 docker-compose run backend python src/manage.py migrate
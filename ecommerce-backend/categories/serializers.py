@@ -5,5 +5,11 @@ from .models import Category
 class CategorySerializer(serializers.ModelSerializer):
     class Meta:
         model = Category
-        fields = ["id", "name", "slug"]
+        fields = ["id", "name", "slug", "parent", "depth", "active_product_count", "min_price", "max_price"]
+        read_only_fields = ["depth", "active_product_count", "min_price", "max_price"]
 
+    def validate_parent(self, parent):
+        # Category.save() refuses these too, but as a ValueError (a 500 here)
+        if parent is not None and self.instance is not None and self.instance.pk in parent.ancestor_ids:
+            raise serializers.ValidationError("A category cannot be moved under itself or one of its descendants.")
+        return parent
@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.cache import bump_generation_safely
+from .models import Category
+
+
+@receiver([post_save, post_delete], sender=Category)
+def invalidate_category_listings(sender, instance, **kwargs):
+    # Product payloads embed category_name, so their listings go stale too
+    bump_generation_safely("categories", "products", f"products:category:{instance.pk}")
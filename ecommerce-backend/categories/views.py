@@ -1,9 +1,26 @@
 from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from core.cache import GenerationCachedListMixin
+from core.conditional import ConditionalGetMixin
 from .models import Category
 from .serializers import CategorySerializer
 
 
-class CategoryViewSet(viewsets.ModelViewSet):
+class CategoryViewSet(ConditionalGetMixin, GenerationCachedListMixin, viewsets.ModelViewSet):
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
+    cache_generations = ["categories"]
+
+    @action(detail=True, methods=["get"])
+    def breadcrumbs(self, request, pk=None):
+        """Root-to-leaf ancestors, resolved from the materialized path in one query."""
+        category = self.get_object()
+        return Response(self.get_serializer(category.ancestors(), many=True).data)
+
+    @action(detail=True, methods=["get"])
+    def subtree(self, request, pk=None):
+        """The category and all descendants in depth-first order (one range scan)."""
+        category = self.get_object()
+        return Response(self.get_serializer(category.subtree().order_by("path"), many=True).data)
 
@@ -0,0 +1,24 @@
+import os
+import shutil
+
+# prometheus_client multiprocess mode: set before any worker imports it
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/prometheus-multiproc")
+
+# Threaded workers: a login waiting on the password hashing pool
+# (users.hashers) only holds its own thread, and the pool's bounded queue
+# and 503 can actually be reached. The ASGI process overrides this with -k.
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
+
+
+def on_starting(server):
+    # Samples from a previous run would be summed into the new one
+    path = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,21 @@
+from django.apps import AppConfig
+from django.db import connections
+from django.db.models.signals import pre_migrate
+
+
+def install_pg_trgm(sender, using="default", **kwargs):
+    # product_name_trgm_idx needs gin_trgm_ops. pre_migrate runs before any
+    # table of this app is created, by migrate and by the test database setup
+    connection = connections[using]
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+
+class ProductsConfig(AppConfig):
+    name = "products"
+
+    def ready(self):
+        from . import signals  # noqa: F401
+
+        pre_migrate.connect(install_pg_trgm, sender=self)
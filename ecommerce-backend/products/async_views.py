@@ -0,0 +1,75 @@
+from decimal import Decimal, InvalidOperation
+
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
+
+from .models import Product
+from .pagination import ProductPagination
+from .serializers import ProductSerializer
+
+
+# Async (ASGI) read path: products serialized as by ProductViewSet, but the
+# worker awaits Postgres instead of blocking on it. No search, facets or
+# response cache, and counts are exact. Served by core.asgi under uvicorn.
+
+ORDERINGS = {"price", "-price", "created_at", "-created_at"}
+
+
+def filtered_products(params):
+    """
+    ProductFilter subset that never touches the database while filtering
+    (django-filter validates ?category= with a sync query).
+    """
+    queryset = Product.objects.filter(is_active=True).select_related("category")
+    category = params.get("category", "")
+    if category.isdigit():
+        queryset = queryset.filter(category_id=int(category))
+    for param, lookup in (("min_price", "price__gte"), ("max_price", "price__lte")):
+        try:
+            queryset = queryset.filter(**{lookup: Decimal(params[param])})
+        except (KeyError, InvalidOperation):
+            pass
+    ordering = params.get("ordering")
+    if ordering in ORDERINGS:
+        queryset = queryset.order_by(ordering, "-id")
+    return queryset
+
+
+def _int(value, default):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+@require_GET
+async def product_list(request):
+    pagination = ProductPagination
+    page_size = min(max(_int(request.GET.get("page_size"), pagination.page_size), 1), pagination.max_page_size)
+    page = max(_int(request.GET.get("page"), 1), 1)
+
+    queryset = filtered_products(request.GET)
+    count = await queryset.acount()
+    offset = (page - 1) * page_size
+    products = [product async for product in queryset[offset:offset + page_size]]
+
+    def link(number):
+        params = request.GET.copy()
+        params["page"] = number
+        return request.build_absolute_uri(f"{request.path}?{params.urlencode()}")
+
+    return JsonResponse({
+        "count": count,
+        "next": link(page + 1) if offset + page_size < count else None,
+        "previous": link(page - 1) if page > 1 else None,
+        "results": ProductSerializer(products, many=True).data,
+    })
+
+
+@require_GET
+async def product_detail(request, pk):
+    try:
+        product = await Product.objects.select_related("category").aget(pk=pk, is_active=True)
+    except Product.DoesNotExist:
+        return JsonResponse({"detail": "Not found."}, status=404)
+    return JsonResponse(ProductSerializer(product).data)
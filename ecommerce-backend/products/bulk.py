@@ -0,0 +1,141 @@
+from django.conf import settings
+from django.db import DatabaseError, transaction
+from django.utils import timezone
+
+from categories.models import Category
+from core.cache import bump_generation_safely
+from .models import Product, ProductTombstone, StockReservation, StockShard
+from .counters import reconcile_category_counters
+from .serializers import BulkProductSerializer, ProductBulkOperationSerializer
+from .signals import product_generations
+
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def apply_bulk_operations(operations):
+    """
+    Validate and apply a list of create/update/delete operations.
+
+    Returns one result per operation, in request order. Invalid operations
+    are reported and skipped; valid ones are written with bulk_create,
+    one bulk_update per set of changed fields and one set of DELETEs per chunk, each chunk in its own
+    transaction, so one bad chunk never rolls back the others.
+    """
+    results = [None] * len(operations)
+    parsed = []
+    for index, raw in enumerate(operations):
+        envelope = ProductBulkOperationSerializer(data=raw)
+        if envelope.is_valid():
+            parsed.append((index, envelope.validated_data))
+        else:
+            results[index] = _error(index, envelope.errors)
+
+    # Two operations on the same product would depend on execution order
+    seen = set()
+    unique = []
+    for index, op in parsed:
+        if "id" in op and op["op"] != "create":
+            if op["id"] in seen:
+                results[index] = _error(index, {"id": "Duplicate operation for this product."})
+                continue
+            seen.add(op["id"])
+        unique.append((index, op))
+
+    # One query each for every referenced product and category
+    targets = Product.objects.in_bulk([op["id"] for _, op in unique if op["op"] != "create"])
+    category_ids = {
+        op["data"]["category"]
+        for _, op in unique
+        if isinstance(op.get("data"), dict) and str(op["data"].get("category", "")).isdigit()
+    }
+    context = {"categories": Category.objects.in_bulk([int(pk) for pk in category_ids])}
+
+    chunk_size = getattr(settings, "PRODUCT_BULK_CHUNK_SIZE", DEFAULT_CHUNK_SIZE)
+    touched_categories = set()
+    for start in range(0, len(unique), chunk_size):
+        chunk = unique[start:start + chunk_size]
+        _apply_chunk(chunk, targets, context, results, touched_categories)
+
+    # None of the writes above send model signals, so refresh counters and
+    # invalidate listings once for the whole batch
+    if touched_categories:
+        reconcile_category_counters(touched_categories)
+        bump_generation_safely("categories", *product_generations(*touched_categories))
+    return results
+
+
+def _apply_chunk(chunk, targets, context, results, touched_categories):
+    creates, updates, deletes = [], [], []
+    # Instances by the exact fields their row sets: writing the union would
+    # put stale in-memory values (e.g. stock taken by reservations since
+    # the snapshot was read) back over columns the row never mentioned
+    update_groups = {}
+
+    for index, op in chunk:
+        instance = targets.get(op.get("id")) if op["op"] != "create" else None
+        if op["op"] != "create" and instance is None:
+            results[index] = _error(index, {"id": "Product not found."})
+            continue
+
+        if op["op"] == "delete":
+            deletes.append((index, instance))
+            continue
+
+        serializer = BulkProductSerializer(
+            instance, data=op["data"], partial=op["op"] == "update", context=context
+        )
+        if not serializer.is_valid():
+            results[index] = _error(index, serializer.errors)
+            continue
+
+        if instance is None:
+            creates.append((index, Product(**serializer.validated_data)))
+        else:
+            for field, value in serializer.validated_data.items():
+                setattr(instance, field, value)
+            # bulk_update never applies auto_now
+            instance.updated_at = timezone.now()
+            fields = frozenset(serializer.validated_data) | {"updated_at"}
+            update_groups.setdefault(fields, []).append(instance)
+            updates.append((index, instance))
+
+    try:
+        with transaction.atomic():
+            if creates:
+                Product.objects.bulk_create([product for _, product in creates])
+            for fields, products in update_groups.items():
+                Product.objects.bulk_update(products, sorted(fields))
+            if deletes:
+                _delete_products([product for _, product in deletes])
+    except DatabaseError as exc:
+        for index, _ in creates + updates + deletes:
+            results[index] = _error(index, {"non_field_errors": [f"Chunk rolled back: {exc}"]})
+        return
+
+    for status, items in (("created", creates), ("updated", updates), ("deleted", deletes)):
+        for index, product in items:
+            results[index] = {"index": index, "status": status, "id": product.pk}
+            touched_categories.add(product.category_id)
+            touched_categories.add(getattr(product, "_initial_category_id", None))
+    touched_categories.discard(None)
+
+
+def _delete_products(products):
+    """
+    Delete without QuerySet.delete()'s per-row post_delete path (a tombstone
+    INSERT, counter UPDATEs and cache bumps for every product).
+    """
+    ids = [product.pk for product in products]
+    ProductTombstone.objects.bulk_create(
+        [ProductTombstone(product_id=product.pk, category_id=product.category_id) for product in products]
+    )
+    # What on_delete=CASCADE would otherwise remove
+    StockReservation.objects.filter(product_id__in=ids).delete()
+    StockShard.objects.filter(product_id__in=ids).delete()
+    queryset = Product.objects.filter(pk__in=ids)
+    queryset._raw_delete(queryset.db)
+
+
+def _error(index, errors):
+    return {"index": index, "status": "error", "errors": errors}
@@ -0,0 +1,133 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core import signing
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import Product, ProductTombstone
+from .serializers import ProductValuesSerializer
+
+
+CURSOR_SALT = "products.changes"
+DEFAULT_BATCH_SIZE = 500
+MAX_BATCH_SIZE = 5000
+# Rows this recent are held back: a transaction that stamped updated_at
+# earlier but commits later would otherwise slip behind a client's cursor
+DEFAULT_SETTLE_SECONDS = 5
+DEFAULT_TOMBSTONE_RETENTION_DAYS = 30
+
+
+class InvalidToken(Exception):
+    pass
+
+
+class TokenExpired(Exception):
+    """The token predates tombstone retention: the client must resync in full."""
+
+
+def encode_token(timestamp, pk, synced):
+    return signing.dumps(
+        {"t": timestamp.isoformat(), "id": pk, "s": synced.isoformat()}, salt=CURSOR_SALT
+    )
+
+
+def decode_token(token):
+    """
+    ``(timestamp, pk, synced)``: the cursor position, and the time from
+    which the client needs every tombstone (tokens without one use the
+    position, as they were issued before it existed).
+    """
+    try:
+        cursor = signing.loads(token, salt=CURSOR_SALT)
+        timestamp = parse_datetime(cursor["t"])
+        pk = int(cursor["id"])
+        synced = parse_datetime(cursor["s"]) if "s" in cursor else timestamp
+    except (signing.BadSignature, KeyError, TypeError, ValueError):
+        raise InvalidToken("Invalid since token")
+    if timestamp is None or synced is None:
+        raise InvalidToken("Invalid since token")
+    return timestamp, pk, synced
+
+
+def tombstone_retention():
+    return timedelta(days=getattr(settings, "PRODUCT_TOMBSTONE_RETENTION_DAYS", DEFAULT_TOMBSTONE_RETENTION_DAYS))
+
+
+def _after(time_field, id_field, position):
+    # Keyset predicate on (time, id); both tables have a matching index
+    if position is None:
+        return Q()
+    timestamp, pk = position
+    return Q(**{f"{time_field}__gt": timestamp}) | Q(**{time_field: timestamp, f"{id_field}__gt": pk})
+
+
+def get_changes(since=None, limit=None):
+    """
+    Products changed after the ``since`` token, oldest first.
+
+    Returns ``(changes, next_token, has_more)``. Each change is an
+    ``upsert`` with the ProductSerializer payload, or a ``delete`` for
+    deleted and deactivated products. Both sources are read with one
+    indexed range scan each, ``limit + 1`` rows at most.
+    """
+    limit = min(max(limit or getattr(settings, "PRODUCT_CHANGES_BATCH_SIZE", DEFAULT_BATCH_SIZE), 1), MAX_BATCH_SIZE)
+    now = timezone.now()
+    if since:
+        *position, synced = decode_token(since)
+    else:
+        # A first sync only needs deletes of products it has already been sent
+        position, synced = None, now
+    # Retention is checked against that time, not the cursor: a first sync
+    # walks rows last changed long ago and must still be able to finish
+    if synced < now - tombstone_retention():
+        raise TokenExpired("Token is older than tombstone retention")
+    horizon = now - timedelta(seconds=getattr(settings, "PRODUCT_CHANGES_SETTLE_SECONDS", DEFAULT_SETTLE_SECONDS))
+
+    rows = list(
+        Product.objects
+        .filter(_after("updated_at", "id", position), updated_at__lt=horizon)
+        .order_by("updated_at", "id")
+        .values(*ProductValuesSerializer.values_fields, "updated_at")[:limit + 1]
+    )
+    tombstones = list(
+        ProductTombstone.objects
+        .filter(_after("deleted_at", "product_id", position), deleted_at__lt=horizon)
+        .order_by("deleted_at", "product_id")
+        .values("product_id", "category_id", "deleted_at")[:limit + 1]
+    )
+
+    serializer = ProductValuesSerializer(None)
+    merged = [(row["updated_at"], row["id"], row) for row in rows]
+    merged += [(row["deleted_at"], row["product_id"], row) for row in tombstones]
+    merged.sort(key=lambda item: item[:2])
+
+    has_more = len(merged) > limit
+    merged = merged[:limit]
+    changes = []
+    for timestamp, pk, row in merged:
+        if "deleted_at" in row or not row["is_active"]:
+            changes.append({
+                "op": "delete", "id": pk, "category": row.get("category_id"), "changed_at": timestamp,
+            })
+        else:
+            changes.append({
+                "op": "upsert", "id": pk, "changed_at": timestamp, "product": serializer.to_representation(row),
+            })
+
+    if merged:
+        timestamp, pk, _ = merged[-1]
+    else:
+        # Nothing left before the horizon: move up to it so idle clients' tokens never expire
+        timestamp, pk = horizon, 0
+    if not has_more:
+        # Caught up to the cursor: from now on only later deletes matter
+        synced = timestamp
+    return changes, encode_token(timestamp, pk, synced), has_more
+
+
+def prune_tombstones():
+    cutoff = timezone.now() - tombstone_retention()
+    deleted, _ = ProductTombstone.objects.filter(deleted_at__lt=cutoff).delete()
+    return deleted
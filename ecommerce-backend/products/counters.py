@@ -0,0 +1,78 @@
+from decimal import Decimal
+
+from django.db.models import Count, DecimalField, F, Max, Min, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest, Least
+
+from categories.models import Category
+from .models import Product
+
+
+# Marker for instances loaded without category/is_active/price (e.g. .only())
+UNKNOWN = object()
+
+
+def live_state(category_id, is_active, price):
+    """What a product contributes to its category's counters: (category, price) or None."""
+    if not is_active or category_id is None or price is None:
+        return None
+    return category_id, Decimal(str(price))
+
+
+def _active_products():
+    return Product.objects.filter(category_id=OuterRef("pk"), is_active=True).order_by().values("category_id")
+
+
+def _price(value):
+    return Value(value, output_field=DecimalField(max_digits=10, decimal_places=2))
+
+
+def add_to_category(category_id, price):
+    Category.objects.filter(pk=category_id).update(
+        active_product_count=F("active_product_count") + 1,
+        min_price=Least(Coalesce(F("min_price"), _price(price)), _price(price)),
+        max_price=Greatest(Coalesce(F("max_price"), _price(price)), _price(price)),
+    )
+
+
+def remove_from_category(category_id, price):
+    Category.objects.filter(pk=category_id).update(
+        active_product_count=Greatest(F("active_product_count") - 1, 0),
+    )
+    # Bounds only need a rescan when the removed price was one of them
+    active = _active_products()
+    Category.objects.filter(pk=category_id).filter(
+        Q(min_price__gte=price) | Q(max_price__lte=price)
+    ).update(
+        min_price=Subquery(active.annotate(value=Min("price")).values("value")),
+        max_price=Subquery(active.annotate(value=Max("price")).values("value")),
+    )
+
+
+def apply_product_change(old, new):
+    """
+    Move a product's contribution from ``old`` to ``new`` live state.
+    Returns True when any category counter was touched.
+    """
+    if old == new:
+        return False
+    if old is not None:
+        remove_from_category(*old)
+    if new is not None:
+        add_to_category(*new)
+    return True
+
+
+def reconcile_category_counters(category_ids=None):
+    """
+    Recompute counters from the products table in one UPDATE; fixes drift
+    from writes that skip signals (bulk_create, queryset.update(), COPY).
+    """
+    active = _active_products()
+    categories = Category.objects.all()
+    if category_ids is not None:
+        categories = categories.filter(pk__in=list(category_ids))
+    return categories.update(
+        active_product_count=Coalesce(Subquery(active.annotate(value=Count("id")).values("value")), 0),
+        min_price=Subquery(active.annotate(value=Min("price")).values("value")),
+        max_price=Subquery(active.annotate(value=Max("price")).values("value")),
+    )
@@ -0,0 +1,69 @@
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+
+# Above this many (estimated) rows an exact COUNT(*) costs more than it is worth
+DEFAULT_ESTIMATE_THRESHOLD = 100_000
+DEFAULT_CACHE_TTL = 60  # seconds
+
+
+def get_count(queryset):
+    """
+    Return ``(count, is_exact)`` for a listing queryset.
+
+    Large result sets get the planner's row estimate; smaller ones get an
+    exact COUNT(*) cached per filter signature for a short TTL.
+    """
+    queryset = queryset.order_by()
+    threshold = getattr(settings, "PRODUCT_COUNT_ESTIMATE_THRESHOLD", DEFAULT_ESTIMATE_THRESHOLD)
+
+    if connections[queryset.db].vendor == "postgresql":
+        estimate = estimate_count(queryset)
+        if estimate is not None and estimate >= threshold:
+            return estimate, False
+
+    key = count_cache_key(queryset)
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, getattr(settings, "PRODUCT_COUNT_CACHE_TTL", DEFAULT_CACHE_TTL))
+    return count, True
+
+
+def estimate_count(queryset):
+    # Unfiltered tables: pg_class.reltuples is a single catalog lookup
+    if not queryset.query.where:
+        return table_row_estimate(queryset.model._meta.db_table, using=queryset.db)
+    return planner_row_estimate(queryset)
+
+
+def table_row_estimate(table, using="default"):
+    with connections[using].cursor() as cursor:
+        cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass", [table])
+        row = cursor.fetchone()
+    # reltuples is -1 until the table has been vacuumed/analyzed
+    if row is None or row[0] < 0:
+        return None
+    return row[0]
+
+
+def planner_row_estimate(queryset):
+    sql, params = queryset.query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def count_cache_key(queryset):
+    # The compiled WHERE clause is the normalized filter signature: the same
+    # filters in any query-string order produce the same SQL.
+    sql, params = queryset.query.sql_with_params()
+    digest = hashlib.sha1(f"{sql}|{params!r}".encode()).hexdigest()
+    return f"product-count:{digest}"
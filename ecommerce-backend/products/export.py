@@ -0,0 +1,100 @@
+import csv
+import zlib
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+
+from core.db import server_side_cursors_enabled
+from .serializers import ProductValuesSerializer
+
+
+DEFAULT_CHUNK_SIZE = 2000
+# Write output in blocks this size instead of one tiny write per row
+BLOCK_SIZE = 64 * 1024
+
+CONTENT_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def export_rows(queryset, chunk_size=None):
+    """
+    Yield ProductSerializer-shaped dicts for every product in ``queryset``.
+
+    Reads ``.values()`` rows through ``.iterator()``, which uses a
+    server-side cursor on PostgreSQL, so memory stays flat however large
+    the catalog is. Behind PgBouncer (server-side cursors disabled) it
+    pages by primary key instead.
+    """
+    chunk_size = chunk_size or getattr(settings, "PRODUCT_EXPORT_CHUNK_SIZE", DEFAULT_CHUNK_SIZE)
+    serializer = ProductValuesSerializer(None)
+    rows = queryset.order_by("pk").values(*ProductValuesSerializer.values_fields)
+    if server_side_cursors_enabled(connections[queryset.db]):
+        rows = rows.iterator(chunk_size=chunk_size)
+    else:
+        rows = _keyset_batches(rows, chunk_size)
+    for row in rows:
+        yield serializer.to_representation(row)
+
+
+def _keyset_batches(rows, chunk_size):
+    last = None
+    while True:
+        batch = list((rows if last is None else rows.filter(pk__gt=last))[:chunk_size])
+        yield from batch
+        if len(batch) < chunk_size:
+            return
+        last = batch[-1]["id"]
+
+
+def ndjson_lines(records):
+    encoder = DjangoJSONEncoder(separators=(",", ":"))
+    for record in records:
+        yield (encoder.encode(record) + "\n").encode()
+
+
+class _Echo:
+    # csv.writer needs a file; this one hands each formatted line back
+    def write(self, value):
+        return value
+
+
+def csv_lines(records):
+    writer = csv.writer(_Echo())
+    columns = list(ProductValuesSerializer.sources)
+    yield writer.writerow(columns).encode()
+    for record in records:
+        yield writer.writerow([record[column] for column in columns]).encode()
+
+
+def buffered(chunks, block_size=BLOCK_SIZE):
+    pending = []
+    size = 0
+    for chunk in chunks:
+        pending.append(chunk)
+        size += len(chunk)
+        if size >= block_size:
+            yield b"".join(pending)
+            pending, size = [], 0
+    if pending:
+        yield b"".join(pending)
+
+
+def gzip_stream(chunks, level=6):
+    """Compress an iterable of bytes incrementally (gzip container, not zlib)."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for block in buffered(chunks):
+        compressed = compressor.compress(block)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def export_stream(queryset, output_format="ndjson", compress=False, chunk_size=None):
+    if output_format not in CONTENT_TYPES:
+        raise ValueError(f"Unsupported export format: {output_format}")
+    records = export_rows(queryset, chunk_size)
+    lines = ndjson_lines(records) if output_format == "ndjson" else csv_lines(records)
+    return gzip_stream(lines) if compress else buffered(lines)
@@ -0,0 +1,101 @@
+from django.conf import settings
+from django.db.models import Case, Count, IntegerField, Q, Value, When
+
+
+FACETS = ("category", "price", "stock")
+DEFAULT_PRICE_BUCKETS = [0, 25, 50, 100, 250, 500, 1000]
+
+
+def get_price_buckets():
+    return getattr(settings, "PRODUCT_FACET_PRICE_BUCKETS", DEFAULT_PRICE_BUCKETS)
+
+
+def price_bucket(edges):
+    # Bucket i holds edges[i] <= price < edges[i + 1]; the last bucket is open ended
+    whens = [When(price__lt=edge, then=Value(i)) for i, edge in enumerate(edges[1:])]
+    return Case(*whens, default=Value(len(edges) - 1), output_field=IntegerField())
+
+
+def compute_facets(queryset, facets):
+    """
+    Category counts, price histogram and stock counts for a filtered queryset.
+
+    All requested facets come from one GROUP BY over the requested dimensions;
+    the per-facet totals are then summed from those rows in Python.
+    """
+    facets = [facet for facet in FACETS if facet in facets]
+    if not facets:
+        return {}
+
+    edges = get_price_buckets()
+    group_by = []
+    if "category" in facets:
+        group_by += ["category_id", "category__name"]
+    if "price" in facets:
+        queryset = queryset.annotate(price_bucket=price_bucket(edges))
+        group_by.append("price_bucket")
+
+    counts = {"count": Count("id"), "in_stock": Count("id", filter=Q(stock__gt=0))}
+    if group_by:
+        rows = queryset.order_by().values(*group_by).annotate(**counts)
+    else:
+        rows = [queryset.order_by().aggregate(**counts)]
+
+    categories, buckets = {}, [0] * len(edges)
+    total = in_stock = 0
+    for row in rows:
+        total += row["count"]
+        in_stock += row["in_stock"]
+        if "category" in facets:
+            entry = categories.setdefault(
+                row["category_id"],
+                {"id": row["category_id"], "name": row["category__name"], "count": 0},
+            )
+            entry["count"] += row["count"]
+        if "price" in facets:
+            buckets[row["price_bucket"]] += row["count"]
+
+    result = {}
+    if "category" in facets:
+        result["category"] = sorted(categories.values(), key=lambda c: (-c["count"], c["name"]))
+    if "price" in facets:
+        result["price"] = [
+            {
+                "min": edge,
+                "max": edges[i + 1] if i + 1 < len(edges) else None,
+                "count": buckets[i],
+            }
+            for i, edge in enumerate(edges)
+        ]
+    if "stock" in facets:
+        result["stock"] = {"in_stock": in_stock, "out_of_stock": total - in_stock}
+    return result
+
+
+class FacetedListMixin:
+    """
+    Adds ``facets`` to paginated list responses when ``?facets=`` is given,
+    e.g. ``?facets=category,price,stock``. List it after the response cache
+    mixin so facets are cached together with the page.
+    """
+    facets_query_param = "facets"
+    _filtered_queryset = None
+
+    def filter_queryset(self, queryset):
+        # Kept so the facets reuse the filtering list() already did instead
+        # of repeating the search and filter lookups
+        queryset = super().filter_queryset(queryset)
+        self._filtered_queryset = queryset
+        return queryset
+
+    def list(self, request, *args, **kwargs):
+        self._filtered_queryset = None
+        response = super().list(request, *args, **kwargs)
+        requested = request.query_params.get(self.facets_query_param)
+        if requested and response.status_code == 200 and isinstance(response.data, dict):
+            queryset = self._filtered_queryset
+            if queryset is None:
+                queryset = self.filter_queryset(self.get_queryset())
+            facets = [facet.strip() for facet in requested.split(",")]
+            response.data["facets"] = compute_facets(queryset, facets)
+        return response
@@ -0,0 +1,79 @@
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import SAFE_METHODS
+
+
+class DynamicFieldsMixin:
+    """Serializer mixin: ``fields=[...]`` keeps only those output fields."""
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop("fields", None)
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+class SparseFieldsetMixin:
+    """
+    ``?fields=id,name,price`` / ``?exclude=description`` on read requests.
+
+    Trims the serializer output and narrows the SQL projection with
+    ``only()``, so unrequested columns (large text in particular) are never
+    read. The serializer declares ``field_columns``: output field -> columns.
+    """
+    fields_query_param = "fields"
+    exclude_query_param = "exclude"
+    # Always loaded: the primary key plus the keyset pagination sort keys
+    always_load = ["id", "created_at", "price"]
+
+    def get_field_columns(self):
+        return getattr(self.get_serializer_class(), "field_columns", None)
+
+    def get_requested_fields(self):
+        if hasattr(self, "_requested_fields"):
+            return self._requested_fields
+
+        self._requested_fields = None
+        field_columns = self.get_field_columns()
+        params = self.request.query_params
+        if not field_columns or self.request.method not in SAFE_METHODS:
+            return None
+
+        selected = list(field_columns)
+        for param in (self.fields_query_param, self.exclude_query_param):
+            value = params.get(param)
+            if not value:
+                continue
+            names = [name.strip() for name in value.split(",") if name.strip()]
+            unknown = [name for name in names if name not in field_columns]
+            if unknown:
+                raise ValidationError({param: f"Unknown field(s): {', '.join(unknown)}"})
+            if param == self.fields_query_param:
+                selected = [name for name in selected if name in names]
+            else:
+                selected = [name for name in selected if name not in names]
+
+        if len(selected) < len(field_columns):
+            self._requested_fields = selected
+        return self._requested_fields
+
+    def get_serializer(self, *args, **kwargs):
+        fields = self.get_requested_fields()
+        if fields is not None:
+            kwargs["fields"] = fields
+        return super().get_serializer(*args, **kwargs)
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        fields = self.get_requested_fields()
+        if fields is None:
+            return queryset
+
+        field_columns = self.get_field_columns()
+        columns = list(self.always_load)
+        for name in fields:
+            columns += field_columns[name]
+        if not any("__" in column for column in columns):
+            # Nothing from the related table was asked for: drop the JOIN too
+            queryset = queryset.select_related(None)
+        return queryset.only(*dict.fromkeys(columns))
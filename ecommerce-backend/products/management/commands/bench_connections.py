@@ -0,0 +1,65 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connection
+from core.benchmarks import percentile
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures per-request DB latency with a fresh connection every time "
+        "vs the configured DB_CONNECTION_MODE (persistent, pool or pgbouncer)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=200)
+
+    def handle(self, *args, **options):
+        settings_dict = connection.settings_dict
+        mode = "pool" if settings_dict.get("OPTIONS", {}).get("pool") else f"CONN_MAX_AGE={settings_dict['CONN_MAX_AGE']}"
+        report = {
+            "fresh connection per request": self.run(self.fresh_request, options["requests"]),
+            f"configured ({mode})": self.run(self.configured_request, options["requests"]),
+        }
+        for label, stats in report.items():
+            self.stdout.write(f"{label}: {json.dumps(stats)}")
+
+        saved = report["fresh connection per request"]["p50_ms"] - report[f"configured ({mode})"]["p50_ms"]
+        self.stdout.write(self.style.SUCCESS(f"Connection setup removed from p50 request latency: {saved:.2f}ms"))
+
+    def query(self):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+
+    def fresh_request(self):
+        # What CONN_MAX_AGE=0 costs: connect (and TLS handshake) on every
+        # request. A raw driver connection, so a configured pool can't serve it
+        params = {k: v for k, v in connection.get_connection_params().items() if k != "pool"}
+        raw = connection.Database.connect(**params)
+        try:
+            with raw.cursor() as cursor:
+                cursor.execute("SELECT 1")
+                cursor.fetchone()
+        finally:
+            raw.close()
+
+    def configured_request(self):
+        # Django's own request_started / request_finished handling
+        close_old_connections()
+        self.query()
+        close_old_connections()
+
+    def run(self, request, total):
+        request()  # warm up
+        timings = []
+        for _ in range(total):
+            started = time.perf_counter()
+            request()
+            timings.append((time.perf_counter() - started) * 1000)
+        return {
+            "p50_ms": round(percentile(timings, 50), 3),
+            "p95_ms": round(percentile(timings, 95), 3),
+            "requests_per_second": round(total / (sum(timings) / 1000), 1),
+        }
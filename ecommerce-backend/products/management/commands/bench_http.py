@@ -0,0 +1,66 @@
+import json
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+from core.benchmarks import percentile
+
+# Same reads on both stacks: DRF views under WSGI vs async views under ASGI.
+# The async views have no response cache, so the WSGI server must run with
+# API_CACHE_ENABLED=False or the numbers compare Redis reads to queries.
+PATHS = {
+    "wsgi": ["/api/products/", "/api/products/?ordering=price&page=5", "/api/categories/"],
+    "asgi": ["/api/async/products/", "/api/async/products/?ordering=price&page=5", "/api/async/categories/"],
+}
+
+
+class Command(BaseCommand):
+    help = "Load-tests the WSGI and ASGI catalog read paths side by side at the same concurrency"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--wsgi-url", default="http://localhost:8000")
+        parser.add_argument("--asgi-url", default="http://localhost:8001")
+        parser.add_argument("--concurrency", type=int, default=32)
+        parser.add_argument("--requests", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        probe = options["wsgi_url"].rstrip("/") + PATHS["wsgi"][0]
+        with urllib.request.urlopen(probe, timeout=30) as response:
+            if response.headers.get("X-Cache"):
+                raise CommandError(
+                    "The WSGI server answers from its response cache; restart it with API_CACHE_ENABLED=False"
+                )
+
+        report = {}
+        for stack, base in (("wsgi", options["wsgi_url"]), ("asgi", options["asgi_url"])):
+            urls = [base.rstrip("/") + path for path in PATHS[stack]]
+            report[stack] = self.run(urls, options["concurrency"], options["requests"])
+            self.stdout.write(f"{stack}: {json.dumps(report[stack])}")
+
+        speedup = report["asgi"]["requests_per_second"] / max(report["wsgi"]["requests_per_second"], 1e-9)
+        self.stdout.write(self.style.SUCCESS(f"ASGI throughput is {speedup:.2f}x WSGI"))
+
+    def run(self, urls, concurrency, total):
+        def fetch(i):
+            started = time.perf_counter()
+            try:
+                with urllib.request.urlopen(urls[i % len(urls)], timeout=30) as response:
+                    response.read()
+                    ok = response.status == 200
+            except OSError:
+                ok = False
+            return (time.perf_counter() - started) * 1000, ok
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(fetch, range(total)))
+        elapsed = time.perf_counter() - started
+
+        timings = [ms for ms, _ in results]
+        return {
+            "requests_per_second": round(total / elapsed, 1),
+            "p50_ms": round(percentile(timings, 50), 2),
+            "p95_ms": round(percentile(timings, 95), 2),
+            "errors": sum(1 for _, ok in results if not ok),
+        }
@@ -0,0 +1,52 @@
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from products.export import CONTENT_TYPES, export_stream
+from products.models import Product
+
+
+class Command(BaseCommand):
+    help = "Streams all active products to a file as NDJSON or CSV (gzipped for *.gz paths)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("output", help='Destination path, or "-" for stdout')
+        parser.add_argument("--format", dest="output_format", choices=sorted(CONTENT_TYPES), default=None,
+                            help="Defaults to the file extension, else ndjson")
+        parser.add_argument("--gzip", action="store_true", help="Compress even without a .gz suffix")
+        parser.add_argument("--chunk-size", type=int, default=None)
+        parser.add_argument("--include-inactive", action="store_true")
+
+    def handle(self, *args, **options):
+        path = options["output"]
+        compress = options["gzip"] or path.endswith(".gz")
+        output_format = options["output_format"] or self.format_from_path(path)
+
+        queryset = Product.objects.all() if options["include_inactive"] else Product.objects.filter(is_active=True)
+        started = time.monotonic()
+        written = 0
+        stream = export_stream(queryset, output_format, compress=compress, chunk_size=options["chunk_size"])
+        try:
+            target = sys.stdout.buffer if path == "-" else open(path, "wb")
+        except OSError as exc:
+            raise CommandError(f"Cannot write {path}: {exc}")
+        try:
+            for block in stream:
+                target.write(block)
+                written += len(block)
+        finally:
+            if target is not sys.stdout.buffer:
+                target.close()
+
+        if path != "-":
+            elapsed = time.monotonic() - started
+            self.stdout.write(self.style.SUCCESS(
+                f"Exported to {path}: {written / 1_048_576:.1f} MiB in {elapsed:.1f}s"
+            ))
+
+    def format_from_path(self, path):
+        name = path[:-3] if path.endswith(".gz") else path
+        for output_format in CONTENT_TYPES:
+            if name.endswith(f".{output_format}"):
+                return output_format
+        return "ndjson"
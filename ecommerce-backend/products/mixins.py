@@ -0,0 +1,25 @@
+from rest_framework.response import Response
+
+
+class ValuesListMixin:
+    """
+    Serves ``list`` from ``.values()`` rows through ``values_serializer_class``
+    instead of model instances. Set it to None to use the regular serializer.
+    """
+    values_serializer_class = None
+
+    def get_requested_fields(self):
+        # Overridden by SparseFieldsetMixin for ?fields= / ?exclude=
+        return None
+
+    def list(self, request, *args, **kwargs):
+        serializer_class = self.values_serializer_class
+        if serializer_class is None:
+            return super().list(request, *args, **kwargs)
+
+        fields = self.get_requested_fields()
+        queryset = self.filter_queryset(self.get_queryset()).values(*serializer_class.values_fields_for(fields))
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(serializer_class(page, many=True, fields=fields).data)
+        return Response(serializer_class(queryset, many=True, fields=fields).data)
@@ -1,3 +1,5 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
 from categories.models import Category
 
@@ -9,19 +11,100 @@ class Product(models.Model):
         on_delete=models.CASCADE
     )
     name = models.CharField(max_length=255)
+    # Supplier feed key: import_products upserts on it. Products created
+    # through the API have none (NULLs never conflict)
+    slug = models.SlugField(max_length=255, unique=True, null=True, blank=True)
     description = models.TextField(blank=True)
     price = models.DecimalField(max_digits=10, decimal_places=2)
     stock = models.PositiveIntegerField(default=0)
+    # Hot items can spread stock over StockShard rows (0 = kept on this row)
+    shard_count = models.PositiveSmallIntegerField(default=0)
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    # Maintained by PostgreSQL itself; name matches rank above description
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector("name", weight="A", config="english")
+            + SearchVector("description", weight="B", config="english")
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
     class Meta:
         ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["price"]),
             models.Index(fields=["is_active"]),
+            # Keyset pagination: range scans on (sort key, id)
+            models.Index(fields=["-created_at", "-id"], name="product_created_id_idx"),
+            models.Index(fields=["price", "id"], name="product_price_id_idx"),
+            # MAX(updated_at) for conditional GETs
+            models.Index(fields=["updated_at", "id"], name="product_updated_id_idx"),
+            # Full-text search and typo-tolerant fallback (requires pg_trgm)
+            GinIndex(fields=["search_vector"], name="product_search_idx"),
+            GinIndex(fields=["name"], name="product_name_trgm_idx", opclasses=["gin_trgm_ops"]),
         ]
 
     def __str__(self):
         return self.name
 
+
+
+class StockReservation(models.Model):
+    HELD = "held"
+    COMMITTED = "committed"
+    RELEASED = "released"
+    STATUS_CHOICES = [(HELD, "Held"), (COMMITTED, "Committed"), (RELEASED, "Released")]
+
+    product = models.ForeignKey(Product, related_name="reservations", on_delete=models.CASCADE)
+    quantity = models.PositiveIntegerField()
+    shard = models.PositiveSmallIntegerField(null=True, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=HELD)
+    expires_at = models.DateTimeField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # The expiry sweep only ever looks at held reservations
+            models.Index(
+                fields=["expires_at"],
+                condition=models.Q(status="held"),
+                name="reservation_held_expiry_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.quantity} x {self.product_id} ({self.status})"
+
+
+class StockShard(models.Model):
+    product = models.ForeignKey(Product, related_name="shards", on_delete=models.CASCADE)
+    shard = models.PositiveSmallIntegerField()
+    stock = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["product", "shard"], name="unique_product_shard"),
+        ]
+
+    def __str__(self):
+        return f"{self.product_id}#{self.shard}: {self.stock}"
+
+
+class ProductTombstone(models.Model):
+    """Left behind by a deleted Product so the change feed can report it."""
+    product_id = models.BigIntegerField()
+    category_id = models.BigIntegerField(null=True, blank=True)
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # Read with the same (timestamp, id) cursor as product_updated_id_idx
+            models.Index(fields=["deleted_at", "product_id"], name="tombstone_deleted_id_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.product_id} deleted at {self.deleted_at}"
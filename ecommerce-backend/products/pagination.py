@@ -1,10 +1,257 @@
-from rest_framework.pagination import PageNumberPagination
+from django.core import signing
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator as DjangoPaginator
+from django.db.models import Q
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .counts import get_count
+
+
+class EstimatedPage(Page):
+    """A page whose "next" comes from one look-ahead row, not from the count."""
+
+    def __init__(self, object_list, number, paginator, has_more):
+        super().__init__(object_list, number, paginator)
+        self.has_more = has_more
+
+    def has_next(self):
+        return self.has_more
+
+
+class EstimatedCountPaginator(DjangoPaginator):
+    """
+    Django paginator whose count comes from the products count strategy.
+
+    An estimated count is for display only: page bounds are then checked by
+    fetching ``per_page + 1`` rows, so an estimate below the real count
+    never hides valid pages.
+    """
+    count_is_exact = True
+
+    @cached_property
+    def count(self):
+        count, self.count_is_exact = get_count(self.object_list)
+        return count
+
+    def validate_number(self, number):
+        self.count  # sets count_is_exact
+        if self.count_is_exact:
+            return super().validate_number(number)
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages["invalid_page"])
+        if number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if self.count_is_exact:
+            return super().page(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        if not rows and number > 1:
+            raise EmptyPage(self.error_messages["no_results"])
+        return EstimatedPage(rows[:self.per_page], number, self, has_more=len(rows) > self.per_page)
 
 
 class ProductPagination(PageNumberPagination):
+    django_paginator_class = EstimatedCountPaginator
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 50
+
+    def get_paginated_response(self, data):
+        return Response({
+            "count": self.page.paginator.count,
+            "count_is_exact": self.page.paginator.count_is_exact,
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"]["count_is_exact"] = {"type": "boolean", "example": True}
+        return response_schema
+
+
+class ProductKeysetPagination(BasePagination):
+    """
+    Keyset (cursor) pagination for deep crawls of the catalog.
+
+    Every page is a single indexed range scan: no OFFSET and no COUNT(*).
+    Cursors are signed so clients cannot forge positions.
+    """
     page_size = 10
     page_size_query_param = "page_size"
     max_page_size = 50
+    cursor_query_param = "cursor"
+    ordering_query_param = "ordering"
+    cursor_salt = "products.pagination.keyset"
+
+    # Each public ordering maps to (sort field, tiebreaker); the tiebreaker
+    # follows the sort direction so one composite index serves the range scan.
+    orderings = {
+        "-created_at": ("-created_at", "-id"),
+        "created_at": ("created_at", "id"),
+        "price": ("price", "id"),
+        "-price": ("-price", "-id"),
+    }
+    default_ordering = "-created_at"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        cursor = self.decode_cursor(request)
+
+        if cursor is None:
+            self.ordering = self.get_ordering(request, view)
+            reverse, position = False, None
+        else:
+            self.ordering = cursor["o"]
+            reverse, position = cursor["r"], cursor["p"]
+
+        fields = self.orderings[self.ordering]
+        if reverse:
+            fields = tuple(self._flip(field) for field in fields)
+
+        queryset = queryset.order_by(*fields)
+        if position is not None:
+            queryset = queryset.filter(self._after(queryset.model, fields, position))
+
+        # Fetch one extra row to know whether another page exists.
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+
+        self.rows = rows
+        self.has_next = has_more if not reverse else position is not None
+        self.has_previous = position is not None if not reverse else has_more
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response({
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if size <= 0:
+            return self.page_size
+        return min(size, self.max_page_size)
+
+    def get_ordering(self, request, view):
+        ordering = request.query_params.get(self.ordering_query_param)
+        if ordering in self.orderings:
+            return ordering
+        view_ordering = getattr(view, "ordering", None) or [self.default_ordering]
+        if view_ordering[0] in self.orderings:
+            return view_ordering[0]
+        return self.default_ordering
+
+    def get_next_link(self):
+        if not self.has_next or not self.rows:
+            return None
+        return self.encode_cursor(self.rows[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.rows:
+            return None
+        return self.encode_cursor(self.rows[0], reverse=True)
+
+    def encode_cursor(self, row, reverse):
+        fields = self.orderings[self.ordering]
+        # Rows are model instances, or dicts on the .values() fast path
+        get = row.get if isinstance(row, dict) else lambda name: getattr(row, name)
+        position = [str(get(field.lstrip("-"))) for field in fields]
+        token = signing.dumps(
+            {"o": self.ordering, "r": reverse, "p": position},
+            salt=self.cursor_salt,
+            compress=True,
+        )
+        url = self.request.build_absolute_uri()
+        # The ordering travels inside the cursor, so drop the raw parameter.
+        url = remove_query_param(url, self.ordering_query_param)
+        return replace_query_param(url, self.cursor_query_param, token)
+
+    def decode_cursor(self, request):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None
+        try:
+            cursor = signing.loads(token, salt=self.cursor_salt)
+        except signing.BadSignature:
+            raise NotFound("Invalid cursor")
+        if cursor.get("o") not in self.orderings:
+            raise NotFound("Invalid cursor")
+        return cursor
+
+    def _after(self, model, fields, position):
+        # (a, b) > (x, y)  ==  a > x OR (a = x AND b > y), per sort direction.
+        (first, tiebreak), (first_value, tiebreak_value) = fields, position
+        first_name, tiebreak_name = first.lstrip("-"), tiebreak.lstrip("-")
+        first_value = model._meta.get_field(first_name).to_python(first_value)
+        tiebreak_value = model._meta.get_field(tiebreak_name).to_python(tiebreak_value)
+        first_op = "lt" if first.startswith("-") else "gt"
+        tiebreak_op = "lt" if tiebreak.startswith("-") else "gt"
+        return (
+            Q(**{f"{first_name}__{first_op}": first_value})
+            | Q(**{first_name: first_value, f"{tiebreak_name}__{tiebreak_op}": tiebreak_value})
+        )
+
+    @staticmethod
+    def _flip(field):
+        return field[1:] if field.startswith("-") else f"-{field}"
+
+
+class SelectablePaginationMixin:
+    """
+    Lets a client opt into keyset pagination with ``?pagination=cursor``
+    while the storefront keeps the default page-number mode.
+    """
+    cursor_pagination_class = ProductKeysetPagination
+    pagination_mode_query_param = "pagination"
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator"):
+            params = self.request.query_params
+            wants_cursor = (
+                params.get(self.pagination_mode_query_param) == "cursor"
+                or ProductKeysetPagination.cursor_query_param in params
+            )
+            if wants_cursor and self.cursor_pagination_class is not None:
+                self._paginator = self.cursor_pagination_class()
+            elif self.pagination_class is None:
+                self._paginator = None
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
 
 pagination_class = ProductPagination
 
@@ -0,0 +1,63 @@
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramSimilarity
+from django.db.models import F
+from rest_framework import filters
+from rest_framework.settings import api_settings
+
+
+class ProductSearchFilter(filters.BaseFilterBackend):
+    """
+    Full-text search on ``Product.search_vector`` (GIN indexed).
+
+    Every word is matched as a prefix ("headph" finds "headphones"). When
+    nothing matches, falls back to trigram similarity on the name so typos
+    still return results. Without an explicit ``?ordering=`` the results are
+    ranked, so list this backend after ``OrderingFilter``.
+    """
+    search_param = api_settings.SEARCH_PARAM
+    ordering_param = api_settings.ORDERING_PARAM
+    search_config = "english"
+    trigram_threshold = 0.3
+
+    def filter_queryset(self, request, queryset, view):
+        term = request.query_params.get(self.search_param, "").strip()
+        words = re.findall(r"\w+", term)
+        if not words:
+            return queryset
+
+        query = SearchQuery(
+            " & ".join(f"{word}:*" for word in words),
+            search_type="raw",
+            config=self.search_config,
+        )
+        ranked = queryset.filter(search_vector=query)
+        if ranked.exists():
+            ranked = ranked.annotate(rank=SearchRank(F("search_vector"), query))
+            return self._order(request, ranked, "-rank")
+
+        # Trigram fallback: the % operator is served by product_name_trgm_idx
+        similar = (
+            queryset
+            .filter(name__trigram_similar=term)
+            .annotate(similarity=TrigramSimilarity("name", term))
+            .filter(similarity__gte=self.trigram_threshold)
+        )
+        return self._order(request, similar, "-similarity")
+
+    def _order(self, request, queryset, relevance):
+        # An explicit ?ordering= from the client wins over relevance
+        if request.query_params.get(self.ordering_param):
+            return queryset
+        return queryset.order_by(relevance, "-id")
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.search_param,
+                "required": False,
+                "in": "query",
+                "description": "Full-text search on name and description (prefix matching).",
+                "schema": {"type": "string"},
+            },
+        ]
@@ -1,10 +1,25 @@
+from django.conf import settings
 from rest_framework import serializers
+from categories.models import Category
+from .fieldsets import DynamicFieldsMixin
 from .models import Product
 
 
-class ProductSerializer(serializers.ModelSerializer):
+class ProductSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     category_name = serializers.CharField(source="category.name", read_only=True)
 
+    # Columns each output field reads, used to narrow the SQL for ?fields=
+    field_columns = {
+        "id": ["id"],
+        "name": ["name"],
+        "description": ["description"],
+        "price": ["price"],
+        "stock": ["stock"],
+        "is_active": ["is_active"],
+        "category": ["category"],
+        "category_name": ["category", "category__name"],
+    }
+
     class Meta:
         model = Product
         fields = [
@@ -18,3 +33,96 @@ class ProductSerializer(serializers.ModelSerializer):
             "category_name",
         ]
 
+
+
+class CachedCategoryField(serializers.PrimaryKeyRelatedField):
+    """
+    Resolves categories from ``context["categories"]`` when present, so a bulk
+    request loads every referenced category in one query instead of one each.
+    """
+
+    def to_internal_value(self, data):
+        categories = self.context.get("categories")
+        if categories is None:
+            return super().to_internal_value(data)
+        try:
+            return categories[int(data)]
+        except (TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        except KeyError:
+            self.fail("does_not_exist", pk_value=data)
+
+
+class BulkProductSerializer(ProductSerializer):
+    category = CachedCategoryField(queryset=Category.objects.all())
+
+
+class ProductBulkOperationSerializer(serializers.Serializer):
+    op = serializers.ChoiceField(choices=["create", "update", "delete"])
+    id = serializers.IntegerField(required=False)
+    data = serializers.DictField(required=False)
+
+    def validate(self, attrs):
+        if attrs["op"] in ("update", "delete") and "id" not in attrs:
+            raise serializers.ValidationError({"id": f"Required for {attrs['op']}."})
+        if attrs["op"] in ("create", "update") and not attrs.get("data"):
+            raise serializers.ValidationError({"data": f"Required for {attrs['op']}."})
+        return attrs
+
+
+class ProductBulkRequestSerializer(serializers.Serializer):
+    operations = serializers.ListField(child=serializers.DictField(), allow_empty=False)
+
+    def validate_operations(self, value):
+        limit = getattr(settings, "PRODUCT_BULK_MAX_OPERATIONS", 50_000)
+        if len(value) > limit:
+            raise serializers.ValidationError(f"At most {limit} operations per request.")
+        return value
+
+
+class ProductValuesSerializer:
+    """
+    Read-only fast path for product lists: builds the exact payload of
+    ProductSerializer straight from ``.values()`` rows, with no model
+    instances and no per-field serializer machinery.
+    """
+    # Output field -> .values() key, in ProductSerializer field order
+    sources = {
+        "id": "id",
+        "name": "name",
+        "description": "description",
+        "price": "price",
+        "stock": "stock",
+        "is_active": "is_active",
+        "category": "category_id",
+        "category_name": "category__name",
+    }
+    # Loaded even when not rendered: keyset pagination cursors read them
+    always_select = ["id", "created_at", "price"]
+    values_fields = list(dict.fromkeys(list(sources.values()) + always_select))
+
+    def __init__(self, rows, many=True, fields=None):
+        self.rows = rows
+        self.many = many
+        self.fields = [name for name in self.sources if fields is None or name in fields]
+        # DRF's own formatting keeps prices byte-identical ("12.50", not "12.5")
+        self.format_price = ProductSerializer().fields["price"].to_representation
+
+    @classmethod
+    def values_fields_for(cls, fields=None):
+        if fields is None:
+            return cls.values_fields
+        selected = [cls.sources[name] for name in cls.sources if name in fields]
+        return list(dict.fromkeys(selected + cls.always_select))
+
+    def to_representation(self, row):
+        data = {name: row[self.sources[name]] for name in self.fields}
+        if "price" in data:
+            data["price"] = self.format_price(data["price"])
+        return data
+
+    @property
+    def data(self):
+        if self.many:
+            return [self.to_representation(row) for row in self.rows]
+        return self.to_representation(self.rows)
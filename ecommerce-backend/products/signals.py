@@ -0,0 +1,58 @@
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from core.cache import bump_generation_safely
+from .counters import UNKNOWN, apply_product_change, live_state, reconcile_category_counters
+from .models import Product, ProductTombstone
+
+
+def product_generations(*category_ids):
+    # Unfiltered listings always change; ?category= listings only for these ids
+    names = ["products"]
+    names += [f"products:category:{pk}" for pk in sorted(set(category_ids)) if pk is not None]
+    return names
+
+
+def _saved_state(instance):
+    # Skip deferred loads (.only()) so tracking never costs an extra query
+    loaded = instance.__dict__
+    if not all(name in loaded for name in ("category_id", "is_active", "price")):
+        return UNKNOWN
+    return live_state(loaded["category_id"], loaded["is_active"], loaded["price"])
+
+
+@receiver(post_init, sender=Product)
+def remember_initial_state(sender, instance, **kwargs):
+    instance._initial_category_id = instance.__dict__.get("category_id")
+    instance._counter_state = _saved_state(instance) if instance.pk else None
+
+
+def _update_counters(instance, old, new):
+    if old is UNKNOWN:
+        reconcile_category_counters({instance.category_id})
+        return True
+    return apply_product_change(old, new)
+
+
+@receiver(post_save, sender=Product)
+def product_saved(sender, instance, **kwargs):
+    new = live_state(instance.category_id, instance.is_active, instance.price)
+    counters_changed = _update_counters(instance, instance._counter_state, new)
+
+    names = product_generations(instance.category_id, instance._initial_category_id)
+    if counters_changed:
+        names.append("categories")
+    bump_generation_safely(*names)
+
+    instance._initial_category_id = instance.category_id
+    instance._counter_state = new
+
+
+@receiver(post_delete, sender=Product)
+def product_deleted(sender, instance, **kwargs):
+    ProductTombstone.objects.create(product_id=instance.pk, category_id=instance.category_id)
+    counters_changed = _update_counters(instance, instance._counter_state, None)
+    names = product_generations(instance.category_id)
+    if counters_changed:
+        names.append("categories")
+    bump_generation_safely(*names)
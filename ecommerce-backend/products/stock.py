@@ -0,0 +1,211 @@
+import random
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Sum
+from django.db.models.functions import Now
+from django.utils import timezone
+
+from core.cache import bump_generation_safely
+from .models import Product, StockReservation, StockShard
+from .signals import product_generations
+
+
+DEFAULT_RESERVATION_TTL = 15 * 60  # seconds
+
+
+class OutOfStock(Exception):
+    pass
+
+
+class ReservationUnavailable(Exception):
+    """The reservation was already committed, released or has expired."""
+
+
+def decrement_stock(product_id, quantity):
+    """
+    Atomically take ``quantity`` units: UPDATE ... SET stock = stock - n
+    WHERE stock >= n. Never oversells and never needs SELECT ... FOR UPDATE.
+    Sharded products are left alone: their units live in the shards, and
+    Product.stock only mirrors the total for display.
+    """
+    return Product.objects.filter(pk=product_id, shard_count=0, stock__gte=quantity).update(
+        stock=F("stock") - quantity, updated_at=Now()
+    ) == 1
+
+
+def increment_stock(product_id, quantity, shard=None):
+    if shard is None:
+        Product.objects.filter(pk=product_id).update(stock=F("stock") + quantity, updated_at=Now())
+    else:
+        StockShard.objects.filter(product_id=product_id, shard=shard).update(stock=F("stock") + quantity)
+
+
+def invalidate_listings(*category_ids):
+    # update() skips post_save, so cached listings would keep showing the old
+    # stock; bump once the change is visible to the request that rebuilds them
+    transaction.on_commit(lambda: bump_generation_safely(*product_generations(*category_ids)))
+
+
+def take_from_shards(product_id, shard_count, quantity):
+    """
+    Try the shards in random order so concurrent buyers of a hot item lock
+    different rows. When no single shard holds ``quantity``, lock them all
+    (in shard order, so these callers never deadlock) and take it from
+    several. Returns the shard to give the units back to: only the total
+    matters, so one shard can take back units taken from several.
+    """
+    shards = list(range(shard_count))
+    random.shuffle(shards)
+    for shard in shards:
+        taken = StockShard.objects.filter(product_id=product_id, shard=shard, stock__gte=quantity).update(
+            stock=F("stock") - quantity
+        )
+        if taken:
+            return shard
+
+    rows = list(
+        StockShard.objects
+        .select_for_update()
+        .filter(product_id=product_id, stock__gt=0)
+        .order_by("shard")
+        .values_list("shard", "stock")
+    )
+    if sum(stock for _, stock in rows) < quantity:
+        return None
+    remaining = quantity
+    for shard, stock in rows:
+        take = min(stock, remaining)
+        StockShard.objects.filter(product_id=product_id, shard=shard).update(stock=F("stock") - take)
+        remaining -= take
+        if not remaining:
+            break
+    return rows[0][0]
+
+
+def reserve(product, quantity, ttl=None):
+    """Hold ``quantity`` units until the reservation is committed or expires."""
+    if quantity <= 0:
+        raise ValueError("Quantity must be positive")
+    ttl = ttl or getattr(settings, "STOCK_RESERVATION_TTL", DEFAULT_RESERVATION_TTL)
+
+    with transaction.atomic():
+        shard = None
+        shard_count = product.shard_count
+        if not shard_count:
+            if decrement_stock(product.pk, quantity):
+                # Shards only reach Product.stock through sync_sharded_stock
+                invalidate_listings(product.category_id)
+            else:
+                # Out of stock, or sharded since this instance was loaded
+                shard_count = Product.objects.filter(pk=product.pk).values_list("shard_count", flat=True).first()
+                if not shard_count:
+                    raise OutOfStock(product.pk)
+        if shard_count:
+            shard = take_from_shards(product.pk, shard_count, quantity)
+            if shard is None:
+                raise OutOfStock(product.pk)
+
+        return StockReservation.objects.create(
+            product=product,
+            quantity=quantity,
+            shard=shard,
+            expires_at=timezone.now() + timedelta(seconds=ttl),
+        )
+
+
+def commit(reservation):
+    """Turn a held reservation into a sale; the stock was already taken."""
+    committed = StockReservation.objects.filter(
+        pk=reservation.pk, status=StockReservation.HELD, expires_at__gt=timezone.now()
+    ).update(status=StockReservation.COMMITTED)
+    if not committed:
+        raise ReservationUnavailable(reservation.pk)
+    reservation.status = StockReservation.COMMITTED
+
+
+def release(reservation):
+    """Give a held reservation's units back."""
+    with transaction.atomic():
+        released = StockReservation.objects.filter(
+            pk=reservation.pk, status=StockReservation.HELD
+        ).update(status=StockReservation.RELEASED)
+        if not released:
+            raise ReservationUnavailable(reservation.pk)
+        increment_stock(reservation.product_id, reservation.quantity, reservation.shard)
+        if reservation.shard is None:
+            invalidate_listings(
+                Product.objects.filter(pk=reservation.product_id).values_list("category_id", flat=True).first()
+            )
+    reservation.status = StockReservation.RELEASED
+
+
+def release_expired(batch_size=500):
+    """
+    Return the stock of expired held reservations. Each batch is claimed
+    with SKIP LOCKED, so several sweepers never block each other.
+    """
+    released = 0
+    touched = set()
+    while True:
+        with transaction.atomic():
+            batch = list(
+                StockReservation.objects
+                .select_for_update(skip_locked=True)
+                .filter(status=StockReservation.HELD, expires_at__lte=timezone.now())
+                .values_list("id", "product_id", "shard", "quantity")[:batch_size]
+            )
+            if not batch:
+                break
+            StockReservation.objects.filter(pk__in=[row[0] for row in batch]).update(
+                status=StockReservation.RELEASED
+            )
+            # One UPDATE per product (or shard), not per reservation
+            totals = defaultdict(int)
+            for _, product_id, shard, quantity in batch:
+                totals[(product_id, shard)] += quantity
+            for (product_id, shard), quantity in totals.items():
+                increment_stock(product_id, quantity, shard)
+                touched.add(product_id)
+        released += len(batch)
+
+    if touched:
+        invalidate_listings(*Product.objects.filter(pk__in=touched).values_list("category_id", flat=True))
+    return released
+
+
+def enable_sharding(product, shards=8):
+    """Spread a hot item's stock over ``shards`` rows."""
+    with transaction.atomic():
+        product = Product.objects.select_for_update().get(pk=product.pk)
+        if product.shard_count:
+            return product
+        base, extra = divmod(product.stock, shards)
+        StockShard.objects.bulk_create([
+            StockShard(product=product, shard=i, stock=base + (1 if i < extra else 0))
+            for i in range(shards)
+        ])
+        product.shard_count = shards
+        product.save(update_fields=["shard_count"])
+    return product
+
+
+def sync_sharded_stock():
+    """Copy shard totals back to Product.stock, which listings display."""
+    totals = (
+        StockShard.objects
+        .filter(product__shard_count__gt=0)
+        .values("product_id")
+        .annotate(total=Sum("stock"))
+    )
+    changed = [
+        row["product_id"]
+        for row in totals
+        if Product.objects.filter(pk=row["product_id"]).exclude(stock=row["total"]).update(
+            stock=row["total"], updated_at=Now()
+        )
+    ]
+    if changed:
+        invalidate_listings(*Product.objects.filter(pk__in=changed).values_list("category_id", flat=True))
@@ -0,0 +1,22 @@
+from celery import shared_task
+
+from .changes import prune_tombstones
+from .counters import reconcile_category_counters
+from .stock import release_expired, sync_sharded_stock
+
+
+@shared_task
+def release_expired_reservations():
+    released = release_expired()
+    sync_sharded_stock()
+    return released
+
+
+@shared_task
+def reconcile_category_counters_task():
+    return reconcile_category_counters()
+
+
+@shared_task
+def prune_product_tombstones():
+    return prune_tombstones()
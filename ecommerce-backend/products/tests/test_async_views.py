@@ -0,0 +1,17 @@
+import pytest
+from django.test import Client
+from django.urls import reverse
+from rest_framework.test import APIClient
+from products.models import Product, Category
+
+
+@pytest.mark.django_db
+def test_async_list_matches_drf_payload():
+    category = Category.objects.create(name="Audio", slug="audio")
+    Product.objects.create(category=category, name="Speaker", price=80, stock=4)
+
+    async_response = Client().get(reverse("async-product-list"))
+    drf_response = APIClient().get(reverse("product-list"))
+
+    assert async_response.status_code == 200
+    assert async_response.json()["results"] == drf_response.json()["results"]
@@ -0,0 +1,76 @@
+import json
+import os
+import random
+from pathlib import Path
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+from core.benchmarks import check_budget, measure
+from products.models import Product, Category
+
+BUDGETS = json.loads((Path(__file__).parent / "benchmark_budgets.json").read_text())
+DATASET_SIZE = int(os.getenv("BENCHMARK_PRODUCTS", "2000"))
+ITERATIONS = int(os.getenv("BENCHMARK_ITERATIONS", "20"))
+# Optional path for the per-scenario timings as JSON, e.g. for a CI artifact
+REPORT_PATH = os.getenv("BENCHMARK_REPORT")
+
+
+@pytest.fixture(scope="module")
+def dataset(django_db_setup, django_db_blocker):
+    rng = random.Random(7)
+    with django_db_blocker.unblock():
+        categories = [
+            Category.objects.create(name=f"Bench {i}", slug=f"bench-{i}") for i in range(20)
+        ]
+        Product.objects.bulk_create(
+            [
+                Product(
+                    category=rng.choice(categories),
+                    name=f"Bench product {i}",
+                    description="Benchmark fixture product with a longer description text.",
+                    price=round(rng.uniform(1, 500), 2),
+                    stock=rng.randint(0, 50),
+                )
+                for i in range(DATASET_SIZE)
+            ],
+            batch_size=1000,
+        )
+        yield categories
+        Product.objects.filter(category__in=categories).delete()
+        Category.objects.filter(pk__in=[c.pk for c in categories]).delete()
+
+
+def deep_cursor_url(client, url):
+    # Walk a few pages so the measured request uses a real keyset position
+    for _ in range(5):
+        url = client.get(url).data["next"]
+    return url
+
+
+@pytest.mark.django_db
+def test_product_list_within_budget(dataset, settings):
+    # Measure the database path, not the response cache
+    settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+    client = APIClient()
+    url = reverse("product-list")
+    scenarios = {
+        "list_default": (url, {}),
+        "list_deep_page": (url, {"page": 20}),
+        "list_cursor_deep": (deep_cursor_url(client, f"{url}?pagination=cursor"), {}),
+        "filter_category": (url, {"category": dataset[0].id}),
+        "filter_price_ordered": (url, {"min_price": 50, "max_price": 200, "ordering": "price"}),
+        "search": (url, {"search": "bench"}),
+        "facets": (url, {"facets": "category,price,stock"}),
+    }
+
+    failures, report = [], {}
+    for name, (path, params) in scenarios.items():
+        stats = measure(lambda: client.get(path, params), iterations=ITERATIONS)
+        assert stats.pop("result").status_code == 200, name
+        report[name] = stats
+        failures += check_budget(name, stats, BUDGETS[name])
+
+    if REPORT_PATH:
+        Path(REPORT_PATH).write_text(json.dumps(report, indent=2))
+    assert not failures, "\n".join(failures)
@@ -0,0 +1,108 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+from products.bulk import _apply_chunk, apply_bulk_operations
+from products.models import Product, ProductTombstone, StockShard, Category
+
+
+@pytest.fixture
+def admin_client(db):
+    admin = get_user_model().objects.create_user(
+        email="admin@example.com", password="password123", is_staff=True
+    )
+    client = APIClient()
+    client.force_authenticate(admin)
+    return client
+
+
+@pytest.mark.django_db
+def test_bulk_requires_admin():
+    url = reverse("product-bulk")
+    payload = {"operations": [{"op": "delete", "id": 1}]}
+    assert APIClient().post(url, payload, format="json").status_code in (401, 403)
+
+    user = get_user_model().objects.create_user(email="buyer@example.com", password="password123")
+    client = APIClient()
+    client.force_authenticate(user)
+    assert client.post(url, payload, format="json").status_code == 403
+
+
+@pytest.mark.django_db
+def test_bulk_operations_report_partial_success(admin_client):
+    category = Category.objects.create(name="Electronics", slug="electronics")
+    laptop = Product.objects.create(category=category, name="Laptop", price=1200, stock=10)
+    mouse = Product.objects.create(category=category, name="Mouse", price=25, stock=10)
+
+    response = admin_client.post(
+        reverse("product-bulk"),
+        {
+            "operations": [
+                {"op": "create", "data": {"name": "Tablet", "price": "300.00", "category": category.id}},
+                {"op": "update", "id": laptop.id, "data": {"price": "999.00"}},
+                {"op": "delete", "id": mouse.id},
+                {"op": "update", "id": 999999, "data": {"price": "1.00"}},
+                {"op": "create", "data": {"name": "No price", "category": category.id}},
+            ]
+        },
+        format="json",
+    )
+
+    assert response.status_code == 207
+    statuses = [result["status"] for result in response.data["results"]]
+    assert statuses == ["created", "updated", "deleted", "error", "error"]
+    laptop.refresh_from_db()
+    assert str(laptop.price) == "999.00"
+    assert not Product.objects.filter(pk=mouse.pk).exists()
+    assert Product.objects.filter(name="Tablet").exists()
+
+
+@pytest.mark.django_db
+def test_bulk_update_only_writes_fields_in_each_row():
+    category = Category.objects.create(name="Electronics", slug="electronics")
+    laptop = Product.objects.create(category=category, name="Laptop", price=1200, stock=10)
+    mouse = Product.objects.create(category=category, name="Mouse", price=25, stock=10)
+    targets = Product.objects.in_bulk([laptop.pk, mouse.pk])
+
+    # A reservation lands after the bulk request read its snapshot
+    Product.objects.filter(pk=laptop.pk).update(stock=7)
+
+    chunk = [
+        (0, {"op": "update", "id": laptop.pk, "data": {"price": "999.00"}}),
+        (1, {"op": "update", "id": mouse.pk, "data": {"stock": 50}}),
+    ]
+    results = [None, None]
+    _apply_chunk(chunk, targets, {"categories": {}}, results, set())
+
+    assert [result["status"] for result in results] == ["updated", "updated"]
+    laptop.refresh_from_db()
+    mouse.refresh_from_db()
+    assert (str(laptop.price), laptop.stock) == ("999.00", 7)
+    assert mouse.stock == 50
+
+
+@pytest.mark.django_db
+def test_bulk_delete_writes_tombstones_and_counters_once():
+    category = Category.objects.create(name="Electronics", slug="electronics")
+    products = [
+        Product.objects.create(category=category, name=f"Item {n}", price=10 + n, stock=1)
+        for n in range(3)
+    ]
+    StockShard.objects.create(product=products[0], shard=0, stock=1)
+
+    with CaptureQueriesContext(connection) as ctx:
+        results = apply_bulk_operations([{"op": "delete", "id": product.pk} for product in products])
+
+    assert [result["status"] for result in results] == ["deleted"] * 3
+    assert not Product.objects.exists()
+    assert not StockShard.objects.exists()
+    assert sorted(ProductTombstone.objects.values_list("product_id", flat=True)) == sorted(p.pk for p in products)
+    tombstone_inserts = [
+        query for query in ctx.captured_queries
+        if query["sql"].startswith("INSERT") and ProductTombstone._meta.db_table in query["sql"]
+    ]
+    assert len(tombstone_inserts) == 1
+    category.refresh_from_db()
+    assert category.active_product_count == 0
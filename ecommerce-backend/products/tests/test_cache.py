@@ -0,0 +1,44 @@
+import logging
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+from core import cache as api_cache
+from products.models import Product, Category
+
+
+@pytest.mark.django_db
+def test_price_change_invalidates_only_affected_listings():
+    phones = Category.objects.create(name="Phones", slug="phones")
+    books = Category.objects.create(name="Books", slug="books")
+    phone = Product.objects.create(category=phones, name="Phone", price=300, stock=2)
+    Product.objects.create(category=books, name="Novel", price=12, stock=2)
+    client = APIClient()
+    url = reverse("product-list")
+
+    assert client.get(url)["X-Cache"] == "MISS"
+    assert client.get(url)["X-Cache"] == "HIT"
+    assert client.get(url, {"category": books.id})["X-Cache"] == "MISS"
+
+    phone.price = 250
+    phone.save()
+
+    response = client.get(url)
+    assert response["X-Cache"] == "MISS"
+    assert "250.00" in [item["price"] for item in response.data["results"]]
+    assert client.get(url, {"category": books.id})["X-Cache"] == "HIT"
+
+
+@pytest.mark.django_db
+def test_cache_outage_does_not_fail_catalog_writes(monkeypatch, caplog):
+    def unavailable(*names):
+        raise ConnectionError("cache is down")
+
+    monkeypatch.setattr(api_cache, "bump_generation", unavailable)
+    with caplog.at_level(logging.ERROR, logger="core.cache"):
+        phones = Category.objects.create(name="Phones", slug="phones")
+        phone = Product.objects.create(category=phones, name="Phone", price=300, stock=2)
+        phone.delete()
+
+    assert not Product.objects.exists()
+    assert "Could not bump cache generations" in caplog.text
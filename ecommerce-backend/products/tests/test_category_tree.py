@@ -0,0 +1,68 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework.test import APIClient
+from products.models import Product, Category
+
+
+@pytest.fixture
+def tree():
+    electronics = Category.objects.create(name="Electronics", slug="electronics")
+    phones = Category.objects.create(name="Phones", slug="phones", parent=electronics)
+    android = Category.objects.create(name="Android", slug="android", parent=phones)
+    books = Category.objects.create(name="Books", slug="books")
+    return electronics, phones, android, books
+
+
+@pytest.mark.django_db
+def test_paths_are_maintained_on_save_and_move(tree):
+    electronics, phones, android, books = tree
+    assert android.path == f"{electronics.pk:010d}/{phones.pk:010d}/{android.pk:010d}/"
+    assert android.depth == 2
+
+    phones.parent = books
+    phones.save()
+    android.refresh_from_db()
+    assert android.path == f"{books.pk:010d}/{phones.pk:010d}/{android.pk:010d}/"
+    assert android.depth == 2
+
+    books.parent = android
+    with pytest.raises(ValueError):
+        books.save()
+
+
+@pytest.mark.django_db
+def test_category_tree_filter_and_endpoints(tree, django_assert_num_queries):
+    electronics, phones, android, books = tree
+    Product.objects.create(category=android, name="Pixel", price=500, stock=1)
+    Product.objects.create(category=electronics, name="Cable", price=5, stock=1)
+    Product.objects.create(category=books, name="Novel", price=15, stock=1)
+    client = APIClient()
+
+    response = client.get(reverse("product-list"), {"category_tree": electronics.pk})
+    assert sorted(p["name"] for p in response.json()["results"]) == ["Cable", "Pixel"]
+
+    response = client.get(reverse("category-breadcrumbs", args=[android.pk]))
+    assert [c["slug"] for c in response.json()] == ["electronics", "phones", "android"]
+
+    response = client.get(reverse("category-subtree", args=[electronics.pk]))
+    assert [c["slug"] for c in response.json()] == ["electronics", "phones", "android"]
+
+    with django_assert_num_queries(2):
+        client.get(reverse("category-breadcrumbs", args=[android.pk]))
+
+
+@pytest.mark.django_db
+def test_moving_a_category_into_its_own_subtree_is_a_400(tree):
+    electronics, phones, android, books = tree
+    client = APIClient()
+    client.force_authenticate(get_user_model().objects.create_user(
+        email="admin@example.com", password="password123", is_staff=True, is_superuser=True
+    ))
+    url = reverse("category-detail", args=[phones.pk])
+
+    assert client.patch(url, {"parent": phones.pk}, format="json").status_code == 400
+    assert client.patch(url, {"parent": android.pk}, format="json").status_code == 400
+    assert client.patch(url, {"parent": books.pk}, format="json").status_code == 200
+    android.refresh_from_db()
+    assert android.path.startswith(f"{books.pk:010d}/")
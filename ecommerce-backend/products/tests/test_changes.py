@@ -0,0 +1,82 @@
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from products.changes import encode_token
+from products.models import Product, Category
+
+
+@pytest.fixture(autouse=True)
+def no_settle_window(settings):
+    settings.PRODUCT_CHANGES_SETTLE_SECONDS = 0
+
+
+def poll(client, since=None, **params):
+    if since:
+        params["since"] = since
+    return client.get(reverse("product-changes"), params).json()
+
+
+@pytest.mark.django_db
+def test_change_feed_reports_upserts_and_tombstones_in_batches():
+    phones = Category.objects.create(name="Phones", slug="phones")
+    pixel = Product.objects.create(category=phones, name="Pixel", price=500, stock=3)
+    galaxy = Product.objects.create(category=phones, name="Galaxy", price=800, stock=1)
+    lumia = Product.objects.create(category=phones, name="Lumia", price=200, stock=0)
+    client = APIClient()
+
+    first = poll(client, limit=2)
+    assert [c["id"] for c in first["results"]] == [pixel.pk, galaxy.pk]
+    assert first["has_more"] is True
+    rest = poll(client, first["next"], limit=2)
+    assert [c["id"] for c in rest["results"]] == [lumia.pk]
+    assert rest["has_more"] is False
+    assert rest["results"][0]["product"]["name"] == "Lumia"
+
+    # Nothing changed: an empty batch, and the token still works
+    idle = poll(client, rest["next"])
+    assert idle["results"] == []
+
+    pixel.price = 450
+    pixel.save()
+    galaxy.is_active = False
+    galaxy.save()
+    lumia_id = lumia.pk
+    lumia.delete()
+
+    changes = poll(client, idle["next"])["results"]
+    assert [(c["op"], c["id"]) for c in changes] == [
+        ("upsert", pixel.pk), ("delete", galaxy.pk), ("delete", lumia_id),
+    ]
+    assert changes[0]["product"]["price"] == "450.00"
+
+
+@pytest.mark.django_db
+def test_change_feed_rejects_bad_tokens():
+    assert APIClient().get(reverse("product-changes"), {"since": "garbage"}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_first_sync_of_an_old_catalog_can_finish(settings):
+    settings.PRODUCT_TOMBSTONE_RETENTION_DAYS = 30
+    phones = Category.objects.create(name="Phones", slug="phones")
+    products = [Product.objects.create(category=phones, name=f"Phone {i}", price=100, stock=1) for i in range(3)]
+    Product.objects.filter(pk__in=[p.pk for p in products]).update(updated_at=timezone.now() - timedelta(days=90))
+    client = APIClient()
+
+    first = poll(client, limit=2)
+    response = client.get(reverse("product-changes"), {"since": first["next"], "limit": 2})
+
+    assert response.status_code == 200
+    assert [c["id"] for c in first["results"] + response.json()["results"]] == [p.pk for p in products]
+
+
+@pytest.mark.django_db
+def test_tokens_past_tombstone_retention_are_gone(settings):
+    settings.PRODUCT_TOMBSTONE_RETENTION_DAYS = 30
+    stale = timezone.now() - timedelta(days=31)
+    token = encode_token(stale, 0, stale)
+
+    assert APIClient().get(reverse("product-changes"), {"since": token}).status_code == 410
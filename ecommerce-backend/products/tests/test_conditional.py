@@ -0,0 +1,55 @@
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+from products.models import Product, Category
+
+
+@pytest.mark.django_db
+def test_list_and_detail_return_304_until_something_changes():
+    phones = Category.objects.create(name="Phones", slug="phones")
+    product = Product.objects.create(category=phones, name="Pixel", price=500, stock=3)
+    client = APIClient()
+
+    for url in (reverse("product-list"), reverse("product-detail", args=[product.pk])):
+        response = client.get(url)
+        assert response.status_code == 200
+        etag = response["ETag"]
+
+        assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+        # Same data, different page of it: a different representation
+        assert client.get(url, {"page_size": 1}, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+    etag = client.get(reverse("product-list"))["ETag"]
+    product.price = 450
+    product.save()
+    assert client.get(reverse("product-list"), HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+
+@pytest.mark.django_db
+def test_category_etag_follows_denormalized_counters():
+    phones = Category.objects.create(name="Phones", slug="phones")
+    client = APIClient()
+    etag = client.get(reverse("category-list"))["ETag"]
+
+    # Counter updates never touch Category.updated_at; the generation covers them
+    Product.objects.create(category=phones, name="Pixel", price=500, stock=3)
+    assert client.get(reverse("category-list"), HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+
+@pytest.mark.django_db
+def test_validating_a_cached_list_costs_no_query(django_assert_num_queries):
+    phones = Category.objects.create(name="Phones", slug="phones")
+    product = Product.objects.create(category=phones, name="Pixel", price=500, stock=3)
+    client = APIClient()
+    etag = client.get(reverse("product-list"))["ETag"]
+
+    with django_assert_num_queries(0):
+        assert client.get(reverse("product-list"), HTTP_IF_NONE_MATCH=etag).status_code == 304
+        assert client.get(reverse("product-list"))["X-Cache"] == "HIT"
+
+    # Details read updated_at from the object they load, with no extra aggregate
+    detail = client.get(reverse("product-detail", args=[product.pk]))
+    assert detail["Last-Modified"]
+    with django_assert_num_queries(1):
+        response = client.get(reverse("product-detail", args=[product.pk]), HTTP_IF_NONE_MATCH=detail["ETag"])
+    assert response.status_code == 304
@@ -0,0 +1,44 @@
+import pytest
+from products.models import Product, Category
+from products.counters import reconcile_category_counters
+
+
+def counters(category):
+    category.refresh_from_db()
+    return category.active_product_count, category.min_price, category.max_price
+
+
+@pytest.mark.django_db
+def test_category_counters_follow_product_changes():
+    phones = Category.objects.create(name="Phones", slug="phones")
+    books = Category.objects.create(name="Books", slug="books")
+
+    cheap = Product.objects.create(category=phones, name="Cheap", price=100, stock=1)
+    Product.objects.create(category=phones, name="Flagship", price=900, stock=1)
+    assert counters(phones) == (2, 100, 900)
+
+    cheap.is_active = False
+    cheap.save()
+    assert counters(phones) == (1, 900, 900)
+
+    cheap.is_active = True
+    cheap.category = books
+    cheap.save()
+    assert counters(phones) == (1, 900, 900)
+    assert counters(books) == (1, 100, 100)
+
+    cheap.delete()
+    assert counters(books) == (0, None, None)
+
+
+@pytest.mark.django_db
+def test_reconcile_repairs_drift_from_bulk_writes():
+    phones = Category.objects.create(name="Phones", slug="phones")
+    Product.objects.bulk_create([
+        Product(category=phones, name="A", price=10, stock=1),
+        Product(category=phones, name="B", price=30, stock=1),
+    ])
+    assert counters(phones) == (0, None, None)
+
+    reconcile_category_counters()
+    assert counters(phones) == (2, 10, 30)
@@ -0,0 +1,29 @@
+import pytest
+from core.db import database_config
+
+URL = "postgres://shop:secret@db:5432/shop"
+
+
+def test_persistent_connections_are_health_checked():
+    config = database_config(URL, conn_max_age=300)
+    assert config["CONN_MAX_AGE"] == 300
+    assert config["CONN_HEALTH_CHECKS"] is True
+    assert "pool" not in config["OPTIONS"]
+
+
+def test_pool_mode_uses_psycopg_pool_without_persistent_connections():
+    config = database_config(URL, mode="pool", pool_min_size=4, pool_max_size=16)
+    assert config["CONN_MAX_AGE"] == 0
+    assert config["OPTIONS"]["pool"] == {"min_size": 4, "max_size": 16, "timeout": 10}
+
+
+def test_pgbouncer_mode_disables_server_side_state():
+    config = database_config(URL, mode="pgbouncer")
+    assert config["DISABLE_SERVER_SIDE_CURSORS"] is True
+    assert config["OPTIONS"]["prepare_threshold"] is None
+    assert config["CONN_MAX_AGE"] > 0
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        database_config(URL, mode="bouncy")
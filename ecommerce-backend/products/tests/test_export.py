@@ -0,0 +1,52 @@
+import csv
+import gzip
+import io
+import json
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APIClient
+from products.models import Product, Category
+
+
+@pytest.fixture
+def catalog():
+    phones = Category.objects.create(name="Phones", slug="phones")
+    Product.objects.create(category=phones, name="Pixel", price="499.50", stock=3)
+    Product.objects.create(category=phones, name="Galaxy", price=899, stock=0)
+    Product.objects.create(category=phones, name="Retired", price=99, stock=0, is_active=False)
+    return phones
+
+
+def body(response):
+    return b"".join(response.streaming_content)
+
+
+@pytest.mark.django_db
+def test_export_streams_ndjson_and_csv(catalog):
+    client = APIClient()
+    response = client.get(reverse("product-export"))
+    assert response["Content-Type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in body(response).splitlines()]
+    assert [row["name"] for row in rows] == ["Pixel", "Galaxy"]
+    assert rows[0]["price"] == "499.50"
+    assert rows[0]["category_name"] == "Phones"
+
+    response = client.get(reverse("product-export"), {"output": "csv", "min_price": 500})
+    rows = list(csv.DictReader(io.StringIO(body(response).decode())))
+    assert [row["name"] for row in rows] == ["Galaxy"]
+
+    assert client.get(reverse("product-export"), {"output": "xml"}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_export_gzip_over_http_and_to_file(catalog, tmp_path):
+    response = APIClient().get(reverse("product-export"), HTTP_ACCEPT_ENCODING="gzip")
+    assert response["Content-Encoding"] == "gzip"
+    assert len(gzip.decompress(body(response)).splitlines()) == 2
+
+    path = tmp_path / "products.csv.gz"
+    call_command("export_products", str(path), stdout=io.StringIO())
+    with gzip.open(path, "rt") as handle:
+        assert len(list(csv.DictReader(handle))) == 2
@@ -0,0 +1,42 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+from products.models import Product, Category
+
+
+@pytest.mark.django_db
+def test_facets_follow_current_filters():
+    phones = Category.objects.create(name="Phones", slug="phones")
+    books = Category.objects.create(name="Books", slug="books")
+    Product.objects.create(category=phones, name="Phone", price=300, stock=0)
+    Product.objects.create(category=phones, name="Case", price=20, stock=4)
+    Product.objects.create(category=books, name="Novel", price=12, stock=2)
+
+    response = APIClient().get(reverse("product-list"), {"facets": "category,price,stock"})
+    facets = response.data["facets"]
+
+    assert facets["category"] == [
+        {"id": phones.id, "name": "Phones", "count": 2},
+        {"id": books.id, "name": "Books", "count": 1},
+    ]
+    assert facets["price"][0] == {"min": 0, "max": 25, "count": 2}
+    assert facets["price"][4] == {"min": 250, "max": 500, "count": 1}
+    assert facets["stock"] == {"in_stock": 2, "out_of_stock": 1}
+
+
+@pytest.mark.django_db
+def test_facets_reuse_the_filtered_listing():
+    phones = Category.objects.create(name="Phones", slug="phones")
+    Product.objects.create(category=phones, name="Pixel", price=500, stock=3)
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = APIClient().get(
+            reverse("product-list"),
+            {"category": phones.id, "search": "pixel", "facets": "category"},
+        )
+
+    assert response.data["facets"]["category"] == [{"id": phones.id, "name": "Phones", "count": 1}]
+    statements = [query["sql"] for query in ctx.captured_queries]
+    assert len(statements) == len(set(statements))
@@ -0,0 +1,27 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from apps.catalog.management.commands.generate_catalog import Command
+from products.models import Product, Category
+
+
+@pytest.mark.django_db
+def test_generate_catalog_builds_a_tree_and_products():
+    call_command(
+        Command(), categories=10, depth=3, products=120, batch_size=50, prefix="t", stdout=StringIO()
+    )
+
+    categories = list(Category.objects.all())
+    assert len(categories) == 10
+    by_id = {category.pk: category for category in categories}
+    for category in categories:
+        parent = by_id.get(category.parent_id)
+        assert category.path == Category.build_path(parent, category.pk)
+        assert category.depth == (parent.depth + 1 if parent else 0)
+
+    assert Product.objects.count() == 120
+    # Products only go to the deepest level
+    assert set(Product.objects.values_list("category__depth", flat=True)) == {2}
+    # Counters were reconciled after the bulk insert
+    assert sum(c.active_product_count for c in Category.objects.all()) == Product.objects.filter(is_active=True).count()
@@ -0,0 +1,61 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from apps.catalog.management.commands.import_products import Command
+from products.models import Product, Category
+
+
+def run_import(path):
+    call_command(Command(), str(path), stdout=StringIO())
+
+
+def rejected_lines(path):
+    with open(f"{path}.rejects.jsonl") as rejects:
+        return [json.loads(line)["line"] for line in rejects]
+
+
+@pytest.fixture
+def phones(db):
+    return Category.objects.create(name="Phones", slug="phones")
+
+
+@pytest.mark.django_db
+def test_csv_import_upserts_on_slug_and_reruns_cleanly(phones, tmp_path):
+    feed = tmp_path / "feed.csv"
+    feed.write_text(
+        "name,slug,description,price,stock,is_active,category\n"
+        "Pixel,pixel,Android phone,499.00,5,true,phones\n"
+        "Lumia,lumia,,199.00,0,false,phones\n"
+        "Mystery,mystery,,10.00,1,true,no-such-category\n"
+    )
+
+    run_import(feed)
+    assert dict(Product.objects.values_list("slug", "price")) == {"pixel": 499, "lumia": 199}
+    assert rejected_lines(feed) == [4]
+    phones.refresh_from_db()
+    assert phones.active_product_count == 1
+
+    # Same feed with a new price: updated in place, no duplicates
+    feed.write_text(feed.read_text().replace("499.00", "449.00"))
+    run_import(feed)
+    assert Product.objects.count() == 2
+    assert Product.objects.get(slug="pixel").price == 449
+
+
+@pytest.mark.django_db
+def test_jsonl_lines_that_are_not_objects_are_rejected(phones, tmp_path):
+    feed = tmp_path / "feed.jsonl"
+    lines = [
+        json.dumps({"name": "Pixel", "slug": "pixel", "price": "499", "stock": 5, "category": "phones"}),
+        "[]",
+        '"x"',
+        "{not json",
+    ]
+    feed.write_text("\n".join(lines) + "\n")
+
+    run_import(feed)
+
+    assert list(Product.objects.values_list("slug", flat=True)) == ["pixel"]
+    assert rejected_lines(feed) == [2, 3, 4]
@@ -0,0 +1,40 @@
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+from products.models import Product, Category
+
+
+@pytest.fixture(autouse=True)
+def metrics_token(settings):
+    settings.METRICS_TOKEN = "s3cret"
+
+
+@pytest.mark.django_db
+def test_metrics_expose_latency_by_route_and_cache_results():
+    phones = Category.objects.create(name="Phones", slug="phones")
+    product = Product.objects.create(category=phones, name="Pixel", price=500, stock=3)
+    client = APIClient()
+    client.get(reverse("product-list"))
+    client.get(reverse("product-list"))
+    client.get(reverse("product-detail", args=[product.pk]))
+
+    body = client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer s3cret").content.decode()
+    assert 'http_request_duration_seconds_count{method="GET",route="/api/products/",status="200"}' in body
+    assert 'route="/api/products/(?P<pk>[^/.]+)/"' in body
+    assert 'api_cache_lookups_total{result="hit",route="/api/products/"}' in body
+    assert "db_request_duration_seconds_bucket" in body
+    assert "# TYPE celery_queue_depth gauge" in body
+    assert 'db_connections_open{alias="default"}' in body
+
+
+def test_metrics_token_is_enforced(settings, client):
+    assert client.get(reverse("metrics")).status_code == 401
+    assert client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer s3cre").status_code == 401
+    assert client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer s3cret").status_code == 200
+
+    # No token configured: closed unless DEBUG
+    settings.METRICS_TOKEN = ""
+    settings.DEBUG = False
+    assert client.get(reverse("metrics")).status_code == 403
+    settings.DEBUG = True
+    assert client.get(reverse("metrics")).status_code == 200
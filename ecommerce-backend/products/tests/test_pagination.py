@@ -0,0 +1,63 @@
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+from products.models import Product, Category
+
+
+@pytest.mark.django_db
+def test_cursor_pagination_walks_every_product_once():
+    category = Category.objects.create(name="Electronics", slug="electronics")
+    for i in range(25):
+        Product.objects.create(category=category, name=f"Item {i}", price=10 + i % 3, stock=1)
+
+    client = APIClient()
+    url = reverse("product-list") + "?pagination=cursor&ordering=price&page_size=7"
+    seen = []
+    while url:
+        response = client.get(url)
+        assert response.status_code == 200
+        assert "count" not in response.data
+        seen.extend(item["id"] for item in response.data["results"])
+        url = response.data["next"]
+
+    assert len(seen) == 25
+    assert len(set(seen)) == 25
+
+
+@pytest.mark.django_db
+def test_tampered_cursor_is_rejected():
+    client = APIClient()
+    response = client.get(reverse("product-list") + "?cursor=not-a-real-cursor")
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_page_number_response_reports_exact_count():
+    category = Category.objects.create(name="Books", slug="books")
+    Product.objects.create(category=category, name="Novel", price=12, stock=3)
+
+    response = APIClient().get(reverse("product-list"))
+    assert response.data["count"] == 1
+    assert response.data["count_is_exact"] is True
+
+
+@pytest.mark.django_db
+def test_low_count_estimate_never_hides_later_pages(monkeypatch):
+    category = Category.objects.create(name="Toys", slug="toys")
+    for i in range(25):
+        Product.objects.create(category=category, name=f"Toy {i}", price=5, stock=1)
+    # Planner estimate well below the real 25 rows
+    monkeypatch.setattr("products.pagination.get_count", lambda queryset: (8, False))
+
+    client = APIClient()
+    response = client.get(reverse("product-list"), {"page": 2})
+    assert response.status_code == 200
+    assert response.data["count_is_exact"] is False
+    assert response.data["next"] is not None
+
+    response = client.get(reverse("product-list"), {"page": 3})
+    assert response.status_code == 200
+    assert len(response.data["results"]) == 5
+    assert response.data["next"] is None
+
+    assert client.get(reverse("product-list"), {"page": 4}).status_code == 404
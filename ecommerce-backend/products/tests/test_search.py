@@ -0,0 +1,30 @@
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+from products.models import Product, Category
+
+
+@pytest.fixture
+def catalog():
+    category = Category.objects.create(name="Electronics", slug="electronics")
+    headphones = Product.objects.create(
+        category=category, name="Wireless Headphones", description="Noise cancelling", price=150, stock=5
+    )
+    Product.objects.create(
+        category=category, name="Phone Charger", description="Works with wireless headphones", price=20, stock=5
+    )
+    Product.objects.create(category=category, name="Garden Hose", price=30, stock=5)
+    return headphones
+
+
+@pytest.mark.django_db
+def test_search_matches_prefix_and_ranks_name_first(catalog):
+    response = APIClient().get(reverse("product-list"), {"search": "headph"})
+    names = [item["name"] for item in response.data["results"]]
+    assert names == ["Wireless Headphones", "Phone Charger"]
+
+
+@pytest.mark.django_db
+def test_search_falls_back_to_trigram_for_typos(catalog):
+    response = APIClient().get(reverse("product-list"), {"search": "Wireles Hedphones"})
+    assert [item["id"] for item in response.data["results"]] == [catalog.id]
@@ -0,0 +1,50 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+from products.models import Product, Category
+from products.serializers import ProductSerializer, ProductValuesSerializer
+
+
+@pytest.mark.django_db
+def test_values_serializer_renders_identical_json():
+    category = Category.objects.create(name="Kitchen", slug="kitchen")
+    Product.objects.create(category=category, name="Kettle", description="1.7 L", price="12.5", stock=3)
+    Product.objects.create(category=category, name="Mug", price=4, stock=0, is_active=False)
+    queryset = Product.objects.select_related("category").order_by("id")
+
+    expected = JSONRenderer().render(ProductSerializer(queryset, many=True).data)
+    rows = queryset.values(*ProductValuesSerializer.values_fields)
+    actual = JSONRenderer().render(ProductValuesSerializer(rows, many=True).data)
+
+    assert actual == expected
+
+
+@pytest.mark.django_db
+def test_sparse_fieldset_trims_payload_and_columns():
+    category = Category.objects.create(name="Kitchen", slug="kitchen")
+    Product.objects.create(category=category, name="Kettle", description="x" * 5000, price=20, stock=3)
+
+    with CaptureQueriesContext(connection) as queries:
+        response = APIClient().get(reverse("product-list"), {"fields": "id,name,price"})
+
+    assert list(response.data["results"][0]) == ["id", "name", "price"]
+    assert not any('"description"' in query["sql"] for query in queries.captured_queries)
+    assert APIClient().get(reverse("product-list"), {"fields": "nope"}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_values_listing_follows_cursor_under_default_ordering():
+    category = Category.objects.create(name="Kitchen", slug="kitchen")
+    for i in range(5):
+        Product.objects.create(category=category, name=f"Pan {i}", price=10 + i, stock=1)
+    client = APIClient()
+
+    first = client.get(reverse("product-list"), {"pagination": "cursor", "page_size": 3})
+    second = client.get(first.data["next"])
+
+    assert second.status_code == 200
+    seen = [row["id"] for row in first.data["results"] + second.data["results"]]
+    assert sorted(seen) == sorted(Product.objects.values_list("id", flat=True))
@@ -0,0 +1,76 @@
+import logging
+
+import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.test import AsyncClient
+from django.urls import reverse
+from rest_framework.test import APIClient
+from core.sqlstats import QueryInstrumentationMiddleware, fingerprint, get_budget, store
+from products.models import Product, Category
+
+
+@pytest.fixture(autouse=True)
+def instrumented(settings):
+    settings.SQL_INSTRUMENTATION_HEADERS = True
+    store.clear()
+
+
+def test_fingerprint_collapses_in_lists():
+    sql = 'SELECT * FROM "p" WHERE "id" IN (%s, %s,  %s)'
+    assert fingerprint(sql) == 'SELECT * FROM "p" WHERE "id" IN (...)'
+
+
+def test_view_budgets_extend_the_defaults(settings):
+    settings.SQL_QUERY_BUDGETS = {
+        "*": {"queries": 20, "duplicates": 0},
+        "ProductViewSet.list": {"queries": 4},
+    }
+
+    assert get_budget("ProductViewSet.list") == {"queries": 4, "duplicates": 0}
+    assert get_budget("CategoryViewSet.list") == {"queries": 20, "duplicates": 0}
+
+
+@pytest.mark.django_db
+def test_headers_histograms_and_budget_warning(settings, caplog):
+    phones = Category.objects.create(name="Phones", slug="phones")
+    Product.objects.create(category=phones, name="Pixel", price=500, stock=3)
+    settings.SQL_QUERY_BUDGETS = {"ProductViewSet.list": {"queries": 1}}
+
+    with caplog.at_level(logging.WARNING, logger="core.sqlstats"):
+        response = APIClient().get(reverse("product-list"))
+
+    assert int(response["X-DB-Query-Count"]) >= 2
+    assert float(response["X-DB-Time-Ms"]) >= 0
+    assert response["X-DB-Duplicate-Queries"] == "0"
+    assert "ms" in response["X-DB-Slowest"]
+    assert "SQL budget exceeded for ProductViewSet.list" in caplog.text
+
+    stats = store.snapshot()["ProductViewSet.list"]
+    assert stats["requests"] == 1
+    assert stats["over_budget"] == 1
+    assert sum(stats["queries"]["buckets"].values()) == 1
+
+
+@pytest.mark.django_db
+def test_search_with_facets_repeats_no_query():
+    phones = Category.objects.create(name="Phones", slug="phones")
+    Product.objects.create(category=phones, name="Pixel", price=500, stock=3)
+
+    response = APIClient().get(reverse("product-list"), {"search": "pixel", "facets": "category"})
+
+    assert response["X-DB-Duplicate-Queries"] == "0"
+
+
+@pytest.mark.django_db
+def test_async_requests_stay_async_and_are_counted():
+    async def view(request):
+        return None
+
+    assert iscoroutinefunction(QueryInstrumentationMiddleware(view))
+
+    phones = Category.objects.create(name="Phones", slug="phones")
+    Product.objects.create(category=phones, name="Pixel", price=500, stock=3)
+    response = async_to_sync(AsyncClient().get)(reverse("async-product-list"))
+
+    assert response.status_code == 200
+    assert int(response["X-DB-Query-Count"]) >= 1
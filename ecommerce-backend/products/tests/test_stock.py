@@ -0,0 +1,101 @@
+import threading
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.utils import timezone
+from products.models import Product, Category, StockReservation
+from core.cache import get_generations
+from products.stock import OutOfStock, enable_sharding, release, release_expired, reserve
+
+
+@pytest.fixture
+def product(db):
+    category = Category.objects.create(name="Consoles", slug="consoles")
+    return Product.objects.create(category=category, name="Console", price=499, stock=10)
+
+
+def run_concurrently(product, buyers):
+    outcomes = []
+
+    def buy():
+        try:
+            reserve(product, 1)
+            outcomes.append(True)
+        except OutOfStock:
+            outcomes.append(False)
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=buy) for _ in range(buyers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_reservations_never_oversell(product):
+    outcomes = run_concurrently(product, buyers=40)
+
+    product.refresh_from_db()
+    assert outcomes.count(True) == 10
+    assert product.stock == 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_sharded_stock_never_oversells(product):
+    product = enable_sharding(product, shards=4)
+    outcomes = run_concurrently(product, buyers=40)
+
+    assert outcomes.count(True) == 10
+    assert sum(shard.stock for shard in product.shards.all()) == 0
+
+
+@pytest.mark.django_db
+def test_expired_reservations_are_released(product):
+    reservation = reserve(product, 3)
+    StockReservation.objects.filter(pk=reservation.pk).update(expires_at=timezone.now() - timedelta(seconds=1))
+
+    assert release_expired() == 1
+    product.refresh_from_db()
+    reservation.refresh_from_db()
+    assert product.stock == 10
+    assert reservation.status == StockReservation.RELEASED
+
+
+@pytest.mark.django_db
+def test_reserve_and_release_invalidate_cached_listings(product, django_capture_on_commit_callbacks):
+    names = ["products", f"products:category:{product.category_id}"]
+    before = get_generations(names)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        reservation = reserve(product, 2)
+    reserved = get_generations(names)
+    assert all(new != old for new, old in zip(reserved, before))
+
+    with django_capture_on_commit_callbacks(execute=True):
+        release(reservation)
+    assert all(new != old for new, old in zip(get_generations(names), reserved))
+
+
+@pytest.mark.django_db
+def test_stale_instance_never_sells_unsharded_stock(product):
+    stale = Product.objects.get(pk=product.pk)
+    enable_sharding(product, shards=4)
+
+    reservation = reserve(stale, 1)
+
+    assert reservation.shard is not None
+    assert sum(shard.stock for shard in product.shards.all()) == 9
+
+
+@pytest.mark.django_db
+def test_reservation_larger_than_any_shard_spans_shards(product):
+    product = enable_sharding(product, shards=4)  # 3, 3, 2, 2
+
+    reserve(product, 7)
+    assert sum(shard.stock for shard in product.shards.all()) == 3
+    with pytest.raises(OutOfStock):
+        reserve(product, 4)
@@ -11,11 +11,26 @@ class ProductViewSet(viewsets.ModelViewSet):
     filterset_fields = ["category"]
     ordering_fields = ["price"]
 
-from rest_framework import viewsets, filters
+from django.http import StreamingHttpResponse
+from rest_framework import viewsets, filters, status
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from .models import Product
 from .serializers import ProductSerializer
 from .filters import ProductFilter
+from .pagination import ProductPagination, SelectablePaginationMixin
+from .search import ProductSearchFilter
+from .facets import FacetedListMixin
+from .bulk import apply_bulk_operations
+from .export import CONTENT_TYPES, export_stream
+from .changes import InvalidToken, TokenExpired, get_changes
+from .serializers import ProductBulkRequestSerializer, ProductValuesSerializer
+from .mixins import ValuesListMixin
+from .fieldsets import SparseFieldsetMixin
+from core.cache import GenerationCachedListMixin
+from core.conditional import ConditionalGetMixin
 
 
 class ProductViewSet(viewsets.ModelViewSet):
@@ -34,11 +49,99 @@ class ProductViewSet(viewsets.ModelViewSet):
     ordering = ["-created_at"]
 
 
-class ProductViewSet(viewsets.ModelViewSet):
+class ProductViewSet(
+    ConditionalGetMixin,
+    GenerationCachedListMixin,
+    FacetedListMixin,
+    SparseFieldsetMixin,
+    ValuesListMixin,
+    SelectablePaginationMixin,
+    viewsets.ModelViewSet,
+):
     queryset = (
         Product.objects
         .filter(is_active=True)
         .select_related("category")
     )
     serializer_class = ProductSerializer
+    # Lists skip model instances entirely (same JSON as ProductSerializer)
+    values_serializer_class = ProductValuesSerializer
+    pagination_class = ProductPagination
+
+    filter_backends = [
+        DjangoFilterBackend,
+        filters.OrderingFilter,
+        ProductSearchFilter,
+    ]
+
+    filterset_class = ProductFilter
+    ordering_fields = ["price", "created_at"]
+    ordering = ["-created_at"]
+
+    def get_cache_generations(self, request):
+        # A single ?category= listing only goes stale when that category changes
+        categories = request.query_params.getlist("category")
+        if len(categories) == 1 and categories[0].isdigit():
+            return [f"products:category:{categories[0]}"]
+        return ["products"]
+
+    @action(detail=False, methods=["post"], url_path="bulk", permission_classes=[IsAdminUser])
+    def bulk(self, request):
+        """
+        Batch create/update/delete in one request:
+        {"operations": [{"op": "update", "id": 7, "data": {"price": "9.99"}}, ...]}
+        """
+        payload = ProductBulkRequestSerializer(data=request.data)
+        payload.is_valid(raise_exception=True)
+
+        results = apply_bulk_operations(payload.validated_data["operations"])
+        failed = sum(1 for result in results if result["status"] == "error")
+        return Response(
+            {"succeeded": len(results) - failed, "failed": failed, "results": results},
+            status=status.HTTP_207_MULTI_STATUS if failed else status.HTTP_200_OK,
+        )
+
+    @action(detail=False, methods=["get"], url_path="export")
+    def export(self, request):
+        """
+        Stream every matching product as NDJSON (default) or ``?output=csv``.
+        Gzipped when the client sends ``Accept-Encoding: gzip``.
+        """
+        output = request.query_params.get("output", "ndjson")
+        if output not in CONTENT_TYPES:
+            return Response(
+                {"output": f"Choose one of: {', '.join(CONTENT_TYPES)}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        compress = "gzip" in request.META.get("HTTP_ACCEPT_ENCODING", "")
+        queryset = self.filter_queryset(self.get_queryset())
+        response = StreamingHttpResponse(
+            export_stream(queryset, output, compress=compress),
+            content_type=CONTENT_TYPES[output],
+        )
+        response["Content-Disposition"] = f'attachment; filename="products.{output}"'
+        if compress:
+            response["Content-Encoding"] = "gzip"
+        response["Vary"] = "Accept-Encoding"
+        return response
+
+    @action(detail=False, methods=["get"], url_path="changes")
+    def changes(self, request):
+        """
+        Incremental sync: products changed since ``?since=<token>``, oldest
+        first. Start without a token, then pass back ``next`` until
+        ``has_more`` is false; keep the last token for the next poll.
+        """
+        try:
+            limit = int(request.query_params.get("limit", 0)) or None
+        except ValueError:
+            limit = None
 
+        try:
+            changes, token, has_more = get_changes(request.query_params.get("since"), limit)
+        except InvalidToken as exc:
+            return Response({"since": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        except TokenExpired as exc:
+            return Response({"since": f"{exc}; resync from scratch."}, status=status.HTTP_410_GONE)
+        return Response({"results": changes, "next": token, "has_more": has_more})
@@ -0,0 +1,81 @@
+import json
+import time
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+# Plan nodes that read rows from a table or index
+SCAN_NODES = {"Seq Scan", "Index Scan", "Index Only Scan", "Bitmap Heap Scan", "Tid Scan"}
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def measure(call, iterations=20, warmup=2):
+    """
+    Run ``call`` repeatedly and report latency percentiles plus the SQL it ran.
+
+    Query count and rows scanned come from the last iteration, so warm
+    caches (if any) are reflected the same way production sees them.
+    """
+    for _ in range(warmup):
+        call()
+
+    timings = []
+    for _ in range(iterations):
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            result = call()
+            timings.append((time.perf_counter() - started) * 1000)
+
+    return {
+        "p50_ms": round(percentile(timings, 50), 2),
+        "p95_ms": round(percentile(timings, 95), 2),
+        "queries": len(queries),
+        "rows_scanned": rows_scanned(queries.captured_queries),
+        "result": result,
+    }
+
+
+def rows_scanned(captured_queries):
+    """Sum of rows read by scan nodes (PostgreSQL only; 0 elsewhere)."""
+    if connection.vendor != "postgresql":
+        return 0
+    total = 0
+    with connection.cursor() as cursor:
+        for query in captured_queries:
+            sql = query["sql"]
+            if not sql.lstrip().upper().startswith("SELECT"):
+                continue
+            # captured SQL already has parameters interpolated
+            cursor.execute(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}")
+            plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            total += _scanned(plan[0]["Plan"])
+    return total
+
+
+def _scanned(node):
+    rows = 0
+    if node.get("Node Type") in SCAN_NODES:
+        rows += (node.get("Actual Rows", 0) + node.get("Rows Removed by Filter", 0)) * node.get("Actual Loops", 1)
+    for child in node.get("Plans", []):
+        rows += _scanned(child)
+    return rows
+
+
+def check_budget(name, stats, budget):
+    """Return human readable budget violations for one scenario."""
+    failures = []
+    for metric, limit_key in (("queries", "max_queries"), ("p95_ms", "p95_ms"), ("rows_scanned", "max_rows_scanned")):
+        limit = budget.get(limit_key)
+        if limit is not None and stats[metric] > limit:
+            failures.append(f"{name}: {metric}={stats[metric]} exceeds budget {limit}")
+    return failures
@@ -0,0 +1,113 @@
+import hashlib
+import logging
+import time
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.response import Response
+
+
+logger = logging.getLogger(__name__)
+
+GENERATION_PREFIX = "generation"
+
+
+def _generation_key(name):
+    return f"{GENERATION_PREFIX}:{name}"
+
+
+def _fresh_generation():
+    # Time based so a generation lost to eviction never reuses an old number
+    return int(time.time() * 1000)
+
+
+def get_generations(names):
+    """Return the current counter for each generation name, creating missing ones."""
+    keys = [_generation_key(name) for name in names]
+    found = cache.get_many(keys)
+    generations = []
+    for key in keys:
+        if key not in found:
+            cache.add(key, _fresh_generation(), timeout=None)
+            found[key] = cache.get(key)
+        generations.append(found[key])
+    return generations
+
+
+def bump_generation(*names):
+    """Invalidate every cached response built on these generations."""
+    for name in names:
+        key = _generation_key(name)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, _fresh_generation(), timeout=None)
+
+
+def bump_generation_safely(*names):
+    """
+    ``bump_generation`` for write paths: a cache outage is logged instead of
+    failing the write. Cached listings then serve stale data for at most
+    ``API_CACHE_TIMEOUT``.
+    """
+    try:
+        bump_generation(*names)
+    except Exception:
+        logger.exception("Could not bump cache generations %s", ", ".join(names))
+
+
+def normalized_query_string(request):
+    # Same filters in any order (or with empty values) share one cache entry
+    params = request.query_params
+    pairs = sorted(
+        (key, value)
+        for key in params
+        for value in params.getlist(key)
+        if value != ""
+    )
+    return urlencode(pairs)
+
+
+class GenerationCachedListMixin:
+    """
+    Caches anonymous ``list`` responses keyed on the normalized query string.
+
+    Entries are never deleted: model signals bump a generation counter that
+    is part of the key, so stale entries simply stop being read.
+    """
+    cache_generations = ()
+    cache_timeout = None
+
+    def get_cache_generations(self, request):
+        return list(self.cache_generations)
+
+    def get_cache_timeout(self):
+        if self.cache_timeout is not None:
+            return self.cache_timeout
+        return getattr(settings, "API_CACHE_TIMEOUT", 300)
+
+    def get_list_cache_key(self, request):
+        names = self.get_cache_generations(request)
+        generations = ".".join(str(g) for g in get_generations(names))
+        query = normalized_query_string(request)
+        digest = hashlib.sha1(f"{request.path}?{query}".encode()).hexdigest()
+        return f"api:{'+'.join(names)}:{generations}:{digest}"
+
+    def is_list_cacheable(self, request):
+        return getattr(settings, "API_CACHE_ENABLED", True) and not request.user.is_authenticated
+
+    def list(self, request, *args, **kwargs):
+        if not self.is_list_cacheable(request):
+            return super().list(request, *args, **kwargs)
+
+        key = self.get_list_cache_key(request)
+        data = cache.get(key)
+        if data is not None:
+            return Response(data, headers={"X-Cache": "HIT"})
+
+        response = super().list(request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.set(key, response.data, self.get_cache_timeout())
+        response["X-Cache"] = "MISS"
+        return response
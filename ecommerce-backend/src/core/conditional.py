@@ -0,0 +1,106 @@
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+from .cache import get_generations, normalized_query_string
+
+
+class ConditionalGetMixin:
+    """
+    ETag / Last-Modified on ``list`` and ``retrieve``.
+
+    Cached listings (views with ``get_cache_generations``) take their ETag
+    from the generation counters alone: every write that can change them
+    already bumps one, so validating costs no query, and a 304 or a cache
+    HIT never touches the database. Other listings fall back to one
+    aggregate over the filtered queryset (``MAX(updated_at)`` and
+    ``COUNT(*)``, so deletes change the tag too).
+
+    Details use the object's ``updated_at`` plus the generations. It is
+    read from the object the view loads anyway, and only queried up front
+    when the request carries ``If-None-Match`` / ``If-Modified-Since``; a
+    match gets a 304 before anything is serialized.
+    """
+    last_modified_field = "updated_at"
+
+    def get_validator_queryset(self, detail):
+        queryset = self.filter_queryset(self.get_queryset())
+        if detail:
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            queryset = queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        return queryset
+
+    def get_validator_generations(self, request):
+        if not hasattr(self, "get_cache_generations"):
+            return []
+        return get_generations(self.get_cache_generations(request))
+
+    def get_object(self):
+        instance = super().get_object()
+        self._validated_instance = instance
+        return instance
+
+    def get_last_modified(self, detail, generations):
+        """``(found, last_modified, count)`` for the requested resource."""
+        if detail:
+            instance = getattr(self, "_validated_instance", None)
+            if instance is not None and self.last_modified_field not in instance.get_deferred_fields():
+                return True, getattr(instance, self.last_modified_field), 1
+            row = self.get_validator_queryset(detail).values_list(self.last_modified_field).first()
+            return row is not None, row[0] if row else None, 1
+        if generations:
+            return True, None, None
+
+        state = self.get_validator_queryset(detail).order_by().aggregate(
+            last_modified=Max(self.last_modified_field), count=Count("pk")
+        )
+        return True, state["last_modified"], state["count"]
+
+    def get_validators(self, request, generations, detail=False):
+        found, last_modified, count = self.get_last_modified(detail, generations)
+        if not found:
+            return None
+
+        # The body also depends on the page, ordering and ?fields=, so the query is hashed in
+        fingerprint = "|".join(str(part) for part in (
+            request.path,
+            normalized_query_string(request),
+            last_modified.isoformat() if last_modified else "",
+            "" if count is None else count,
+            ".".join(str(g) for g in generations),
+        ))
+        etag = f'W/"{hashlib.sha1(fingerprint.encode()).hexdigest()}"'
+        return etag, last_modified.timestamp() if last_modified else None
+
+    def conditional_response(self, handler, request, *args, detail=False, **kwargs):
+        # Read before the body is built: a write in between makes the tag
+        # older than the body (a harmless extra 200), never newer
+        generations = self.get_validator_generations(request)
+        self._validated_instance = None
+        validators = None
+        if not detail or "HTTP_IF_NONE_MATCH" in request.META or "HTTP_IF_MODIFIED_SINCE" in request.META:
+            validators = self.get_validators(request, generations, detail=detail)
+        if validators is not None:
+            etag, last_modified = validators
+            response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+            if response is not None:
+                return response
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            if validators is None:
+                validators = self.get_validators(request, generations, detail=detail)
+            if validators is not None:
+                etag, last_modified = validators
+                response["ETag"] = etag
+                if last_modified is not None:
+                    response["Last-Modified"] = http_date(last_modified)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(super().retrieve, request, *args, detail=True, **kwargs)
@@ -0,0 +1,46 @@
+import dj_database_url
+
+
+# How Django holds its PostgreSQL connections (DB_CONNECTION_MODE):
+#   persistent - one connection per worker thread, reused for CONN_MAX_AGE
+#                seconds and health-checked before reuse
+#   pool       - psycopg 3's native pool (Django 5.1+), shared by a worker's
+#                threads; Django requires CONN_MAX_AGE = 0 with it
+#   pgbouncer  - behind PgBouncer in transaction mode: connections to the
+#                bouncer are kept, but a session can change server connection
+#                between transactions, so no server-side cursors and no
+#                prepared statements
+#   none       - a new connection (and TLS handshake) per request
+MODES = ("persistent", "pool", "pgbouncer", "none")
+
+
+def database_config(url, mode="persistent", conn_max_age=600, pool_min_size=2, pool_max_size=10, pool_timeout=10):
+    if mode not in MODES:
+        raise ValueError(f"DB_CONNECTION_MODE must be one of {', '.join(MODES)}, not {mode!r}")
+
+    config = dj_database_url.parse(url) if url else dj_database_url.config()
+    options = config.setdefault("OPTIONS", {})
+
+    if mode == "none":
+        config["CONN_MAX_AGE"] = 0
+    elif mode == "pool":
+        config["CONN_MAX_AGE"] = 0
+        options["pool"] = {
+            "min_size": pool_min_size,
+            "max_size": pool_max_size,
+            "timeout": pool_timeout,
+        }
+    else:
+        config["CONN_MAX_AGE"] = conn_max_age
+        # A connection dropped by a failover or idle timeout is replaced
+        # before the request uses it, instead of failing the request
+        config["CONN_HEALTH_CHECKS"] = True
+
+    if mode == "pgbouncer":
+        config["DISABLE_SERVER_SIDE_CURSORS"] = True
+        options["prepare_threshold"] = None
+    return config
+
+
+def server_side_cursors_enabled(connection):
+    return not connection.settings_dict.get("DISABLE_SERVER_SIDE_CURSORS")
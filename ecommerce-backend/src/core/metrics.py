@@ -0,0 +1,177 @@
+import hmac
+import logging
+import os
+import threading
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.http import HttpResponse
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client.core import GaugeMetricFamily
+
+
+logger = logging.getLogger(__name__)
+
+# With PROMETHEUS_MULTIPROC_DIR set (see gunicorn.conf.py) every worker
+# writes its samples to mmap'd files there and a scrape sums them, so the
+# numbers are right whichever worker answers /metrics.
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Request latency by route, method and status",
+    ["route", "method", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+DB_QUERY_DURATION = Histogram(
+    "db_request_duration_seconds",
+    "Total DB time per request, by route",
+    ["route"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+CACHE_LOOKUPS = Counter(
+    "api_cache_lookups_total",
+    "API response cache lookups (X-Cache header), by route and result",
+    ["route", "result"],
+)
+# Set by every worker after each request; a scrape sums the live workers
+DB_CONNECTIONS_OPEN = Gauge(
+    "db_connections_open",
+    "Open database connections, summed over live workers",
+    ["alias"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "Connection pool state (psycopg_pool), summed over live workers",
+    ["alias", "state"],
+    multiprocess_mode="livesum",
+)
+
+# Django connections are per thread: (thread, alias) -> open, for this worker
+_open_connections = {}
+_open_connections_lock = threading.Lock()
+
+
+def route_of(request):
+    # The URL pattern, not the path: /api/products/7/ and /8/ share a series
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return "unmatched"
+    if not match.route:
+        return match.view_name or "unmatched"
+    # DRF routers add regex anchors to every segment
+    return "/" + match.route.replace("^", "").replace("$", "")
+
+
+class PrometheusMiddleware:
+    """Outermost middleware: times the whole request and records it by route."""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        started = time.perf_counter()
+        response = self.get_response(request)
+        self.record(request, response, time.perf_counter() - started)
+        return response
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        response = await self.get_response(request)
+        self.record(request, response, time.perf_counter() - started)
+        return response
+
+    def record(self, request, response, elapsed):
+        route = route_of(request)
+        REQUEST_LATENCY.labels(route, request.method, response.status_code).observe(elapsed)
+        db_ms = getattr(request, "db_time_ms", None)
+        if db_ms is not None:
+            DB_QUERY_DURATION.labels(route).observe(db_ms / 1000)
+        if response.has_header("X-Cache"):
+            CACHE_LOOKUPS.labels(route, response["X-Cache"].lower()).inc()
+        record_db_connections()
+
+
+def record_db_connections():
+    """Publishes this worker's open connections (all its threads) and pool state."""
+    thread = threading.get_ident()
+    initialized = connections.all(initialized_only=True)
+    with _open_connections_lock:
+        for connection in initialized:
+            _open_connections[thread, connection.alias] = 1 if connection.connection is not None else 0
+        totals = {}
+        for (_, alias), is_open in _open_connections.items():
+            totals[alias] = totals.get(alias, 0) + is_open
+    for alias, total in totals.items():
+        DB_CONNECTIONS_OPEN.labels(alias).set(total)
+
+    # The pool is shared by the worker's threads, so any of them can report it
+    for connection in initialized:
+        pool = getattr(connection, "pool", None)
+        if pool is not None:
+            stats = pool.get_stats()
+            DB_POOL_CONNECTIONS.labels(connection.alias, "size").set(stats.get("pool_size", 0))
+            DB_POOL_CONNECTIONS.labels(connection.alias, "available").set(stats.get("pool_available", 0))
+            DB_POOL_CONNECTIONS.labels(connection.alias, "waiting").set(stats.get("requests_waiting", 0))
+
+
+class CeleryQueueCollector:
+    """Broker queue lengths, read from Redis at scrape time."""
+
+    def collect(self):
+        depth = GaugeMetricFamily("celery_queue_depth", "Messages waiting in each Celery queue", labels=["queue"])
+        try:
+            import redis
+
+            client = redis.Redis.from_url(settings.CELERY_BROKER_URL, socket_timeout=0.5)
+            for queue in getattr(settings, "METRICS_CELERY_QUEUES", ["celery"]):
+                depth.add_metric([queue], client.llen(queue))
+        except Exception:
+            logger.warning("Could not read Celery queue depth", exc_info=True)
+        yield depth
+
+
+def get_registry():
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+    return REGISTRY
+
+
+# Scrape-time only, never written to the multiprocess files
+scrape_registry = CollectorRegistry()
+scrape_registry.register(CeleryQueueCollector())
+
+
+def metrics_view(request):
+    """
+    Prometheus text format, behind ``Authorization: Bearer <METRICS_TOKEN>``.
+    Without a token it is only served with DEBUG on.
+    """
+    token = getattr(settings, "METRICS_TOKEN", "")
+    if not token:
+        if not settings.DEBUG:
+            return HttpResponse(status=403)
+    elif not hmac.compare_digest(request.headers.get("Authorization", "").encode(), f"Bearer {token}".encode()):
+        return HttpResponse(status=401)
+
+    output = generate_latest(get_registry()) + generate_latest(scrape_registry)
+    return HttpResponse(output, content_type=CONTENT_TYPE_LATEST)
@@ -171,10 +171,18 @@ import os
 DEBUG = os.getenv('DEBUG', 'False') == 'True'
 ALLOWED_HOSTS = os.getenv('ALLOWED_HOSTS', '*').split(',')
 
-# Use DATABASE_URL from your hosting provider
+# Use DATABASE_URL from your hosting provider. Connection reuse is set by
+# DB_CONNECTION_MODE: persistent (default), pool, pgbouncer or none (core/db.py)
+from core.db import database_config
+
 DATABASES = {
-    'default': dj_database_url.config(
-        default=os.getenv('DATABASE_URL')
+    'default': database_config(
+        os.getenv('DATABASE_URL'),
+        mode=os.getenv('DB_CONNECTION_MODE', 'persistent'),
+        conn_max_age=int(os.getenv('DB_CONN_MAX_AGE', '600')),
+        pool_min_size=int(os.getenv('DB_POOL_MIN_SIZE', '2')),
+        pool_max_size=int(os.getenv('DB_POOL_MAX_SIZE', '10')),
+        pool_timeout=float(os.getenv('DB_POOL_TIMEOUT', '10')),
     )
 }
 
@@ -182,6 +190,140 @@ DATABASES = {
 STATIC_URL = '/static/'
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 
+# Full-text search and trigram lookups on products
+INSTALLED_APPS += ['django.contrib.postgres']
+
+# Shared cache (Redis) for counts, responses and throttles
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.getenv('REDIS_URL', 'redis://localhost:6379/1'),
+    }
+}
+
+# Anonymous list responses; invalidated by generation counters, not by TTL
+API_CACHE_TIMEOUT = int(os.getenv('API_CACHE_TIMEOUT', '3600'))
+# Off for like-for-like load tests against the uncached async views (bench_http)
+API_CACHE_ENABLED = os.getenv('API_CACHE_ENABLED', 'True') == 'True'
+
+# Celery (worker + beat) on the same Redis instance
+CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL', 'redis://localhost:6379/0')
+CELERY_BEAT_SCHEDULE = {
+    'release-expired-stock-reservations': {
+        'task': 'products.tasks.release_expired_reservations',
+        'schedule': 60.0,
+    },
+    'reconcile-category-counters': {
+        'task': 'products.tasks.reconcile_category_counters_task',
+        'schedule': 15 * 60.0,
+    },
+    'prune-product-tombstones': {
+        'task': 'products.tasks.prune_product_tombstones',
+        'schedule': 24 * 60 * 60.0,
+    },
+    'send-welcome-emails': {
+        'task': 'users.tasks.send_welcome_emails',
+        'schedule': 10.0,
+    },
+}
+
+# How long checkout holds stock before the sweep gives it back (seconds)
+STOCK_RESERVATION_TTL = int(os.getenv('STOCK_RESERVATION_TTL', '900'))
+
+# JWT auth without a users.User query per request: verified tokens and user
+# snapshots are cached in-process (bounded LRU) and in Redis
+REST_FRAMEWORK.update({
+    'DEFAULT_AUTHENTICATION_CLASSES': (
+        'users.authentication.CachedJWTAuthentication',
+    ),
+})
+JWT_TOKEN_CACHE_SIZE = 10000
+JWT_USER_CACHE_SIZE = 10000
+JWT_USER_LOCAL_TTL = 30
+JWT_USER_CACHE_TTL = 300
+
+# Product listings: use planner estimates instead of COUNT(*) above this size
+PRODUCT_COUNT_ESTIMATE_THRESHOLD = int(os.getenv('PRODUCT_COUNT_ESTIMATE_THRESHOLD', '100000'))
+PRODUCT_COUNT_CACHE_TTL = int(os.getenv('PRODUCT_COUNT_CACHE_TTL', '60'))
+
+# Lower edges of the ?facets=price histogram buckets
+PRODUCT_FACET_PRICE_BUCKETS = [0, 25, 50, 100, 250, 500, 1000]
+
+# POST /api/products/bulk/: request size limit and rows per transaction
+PRODUCT_BULK_MAX_OPERATIONS = int(os.getenv('PRODUCT_BULK_MAX_OPERATIONS', '50000'))
+PRODUCT_BULK_CHUNK_SIZE = int(os.getenv('PRODUCT_BULK_CHUNK_SIZE', '1000'))
+
+# Rows fetched per server-side cursor round trip by the catalog export
+PRODUCT_EXPORT_CHUNK_SIZE = int(os.getenv('PRODUCT_EXPORT_CHUNK_SIZE', '2000'))
+
+# GET /api/products/changes/: rows per batch, how long recent writes are held
+# back so late commits are never skipped, and how long deletions are kept
+PRODUCT_CHANGES_BATCH_SIZE = int(os.getenv('PRODUCT_CHANGES_BATCH_SIZE', '500'))
+PRODUCT_CHANGES_SETTLE_SECONDS = int(os.getenv('PRODUCT_CHANGES_SETTLE_SECONDS', '5'))
+PRODUCT_TOMBSTONE_RETENTION_DAYS = int(os.getenv('PRODUCT_TOMBSTONE_RETENTION_DAYS', '30'))
+
+# Outgoing mail: SMTP in production, the console backend locally (tests use locmem)
+EMAIL_BACKEND = os.getenv('EMAIL_BACKEND', 'django.core.mail.backends.console.EmailBackend')
+EMAIL_HOST = os.getenv('EMAIL_HOST', 'localhost')
+EMAIL_PORT = int(os.getenv('EMAIL_PORT', '587'))
+EMAIL_HOST_USER = os.getenv('EMAIL_HOST_USER', '')
+EMAIL_HOST_PASSWORD = os.getenv('EMAIL_HOST_PASSWORD', '')
+EMAIL_USE_TLS = os.getenv('EMAIL_USE_TLS', 'True') == 'True'
+EMAIL_TIMEOUT = int(os.getenv('EMAIL_TIMEOUT', '10'))
+DEFAULT_FROM_EMAIL = os.getenv('DEFAULT_FROM_EMAIL', 'Nexus <no-reply@nexus.local>')
+# Welcome emails sent per SMTP connection by users.tasks.send_welcome_emails
+WELCOME_EMAIL_BATCH_SIZE = int(os.getenv('WELCOME_EMAIL_BATCH_SIZE', '100'))
+
+# Argon2 (memory-hard) for new hashes. PBKDF2 hashes still verify and are
+# rehashed to Argon2 on the next successful login. Both run in a bounded
+# process pool (users.hashers): PASSWORD_HASHING_WORKERS processes per web
+# worker (keep web workers x this <= cores), 0 = inline
+PASSWORD_HASHERS = [
+    'users.hashers.PooledArgon2PasswordHasher',
+    'users.hashers.PooledPBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+]
+PASSWORD_HASHING_WORKERS = int(os.getenv('PASSWORD_HASHING_WORKERS', '1'))
+# Jobs allowed per worker (running + queued), and how long a login waits for a slot before a 503
+PASSWORD_HASHING_QUEUE = int(os.getenv('PASSWORD_HASHING_QUEUE', '4'))
+PASSWORD_HASHING_QUEUE_TIMEOUT = float(os.getenv('PASSWORD_HASHING_QUEUE_TIMEOUT', '5'))
+# A full pool answers 503 in the admin login too, not only in DRF views
+MIDDLEWARE += ['users.hashers.HashingOverloadedMiddleware']
+
+# Token-bucket throttles on the auth endpoints (users.throttling), shared
+# through Redis; unset THROTTLE_REDIS_URL to keep buckets in process memory
+REST_FRAMEWORK.update({
+    'DEFAULT_THROTTLE_RATES': {
+        'login': os.getenv('THROTTLE_LOGIN', '30/min'),
+        'login_email': os.getenv('THROTTLE_LOGIN_EMAIL', '5/min'),
+        'register': os.getenv('THROTTLE_REGISTER', '10/hour'),
+        'token_refresh': os.getenv('THROTTLE_TOKEN_REFRESH', '60/min'),
+    },
+})
+THROTTLE_REDIS_URL = os.getenv('THROTTLE_REDIS_URL', os.getenv('REDIS_URL', 'redis://localhost:6379/1'))
+# Share of a bucket a well-behaved client may take per Redis round trip
+THROTTLE_LEASE_FRACTION = float(os.getenv('THROTTLE_LEASE_FRACTION', '0.1'))
+
+# Per-view SQL counts and timings (core.sqlstats). X-DB-* response headers are
+# meant for staging; budgets log a warning when crossed ("*" = every view)
+MIDDLEWARE += ['core.sqlstats.QueryInstrumentationMiddleware']
+SQL_INSTRUMENTATION = os.getenv('SQL_INSTRUMENTATION', 'True') == 'True'
+SQL_INSTRUMENTATION_HEADERS = os.getenv('SQL_INSTRUMENTATION_HEADERS', str(DEBUG)) == 'True'
+SQL_QUERY_BUDGETS = {
+    '*': {'queries': 20, 'db_ms': 250, 'duplicates': 0},
+    'ProductViewSet.list': {'queries': 4, 'db_ms': 100},
+    'ProductViewSet.retrieve': {'queries': 2, 'db_ms': 25},
+    'CategoryViewSet.list': {'queries': 3, 'db_ms': 50},
+    'LoginView.post': {'queries': 3},
+}
+
+# Prometheus metrics at /metrics (core.metrics). Under gunicorn,
+# gunicorn.conf.py sets PROMETHEUS_MULTIPROC_DIR so all workers are counted
+MIDDLEWARE.insert(0, 'core.metrics.PrometheusMiddleware')
+# Bearer token for scrapes; without one /metrics is only served with DEBUG on
+METRICS_TOKEN = os.getenv('METRICS_TOKEN', '')
+METRICS_CELERY_QUEUES = os.getenv('METRICS_CELERY_QUEUES', 'celery').split(',')
+
 
 git add core/settings.py Procfile requirements.txt
 git commit -m "build(deploy): configure production settings and database for hosting"
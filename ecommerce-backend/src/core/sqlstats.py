@@ -0,0 +1,238 @@
+import bisect
+import hashlib
+import logging
+import re
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+
+logger = logging.getLogger(__name__)
+
+# Histogram upper bounds; the last bucket is +Inf
+QUERY_COUNT_BUCKETS = [1, 2, 5, 10, 20, 50, 100]
+DB_TIME_BUCKETS_MS = [1, 5, 10, 25, 50, 100, 250, 500, 1000]
+
+_IN_LIST = re.compile(r"\((?:\s*%s\s*,)+\s*%s\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(sql):
+    """SQL with placeholders, IN lists collapsed: one shape per query site."""
+    return _WHITESPACE.sub(" ", _IN_LIST.sub("(...)", sql)).strip()
+
+
+def fingerprint_id(text):
+    return hashlib.sha1(text.encode()).hexdigest()[:12]
+
+
+class QueryRecorder:
+    """``connection.execute_wrapper`` that times every statement of a request."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.seen = {}
+        self.duplicates = 0
+        self.slowest = (0.0, "")
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = (time.perf_counter() - started) * 1000
+            self.count += 1
+            self.duration += elapsed
+            # Same statement and same parameters: a duplicate, not just an N+1 shape
+            key = (sql, repr(params))
+            self.seen[key] = self.seen.get(key, 0) + 1
+            if self.seen[key] > 1:
+                self.duplicates += 1
+            if elapsed > self.slowest[0]:
+                self.slowest = (elapsed, sql)
+
+
+class Histogram:
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+
+    def as_dict(self):
+        labels = [str(bound) for bound in self.bounds] + ["+Inf"]
+        return {"buckets": dict(zip(labels, self.counts)), "sum": round(self.total, 2)}
+
+
+class ViewStats:
+    def __init__(self):
+        self.requests = 0
+        self.queries = Histogram(QUERY_COUNT_BUCKETS)
+        self.db_time = Histogram(DB_TIME_BUCKETS_MS)
+        self.duplicates = 0
+        self.over_budget = 0
+        self.slowest = (0.0, "")
+
+    def as_dict(self):
+        ms, sql = self.slowest
+        return {
+            "requests": self.requests,
+            "queries": self.queries.as_dict(),
+            "db_time_ms": self.db_time.as_dict(),
+            "duplicate_queries": self.duplicates,
+            "over_budget": self.over_budget,
+            "slowest": {"ms": round(ms, 2), "fingerprint": fingerprint_id(sql), "sql": sql} if sql else None,
+        }
+
+
+class SQLStatsStore:
+    """Per-process aggregates, keyed by view name."""
+
+    def __init__(self):
+        self.views = {}
+        self.lock = threading.Lock()
+
+    def record(self, view, recorder, over_budget):
+        with self.lock:
+            stats = self.views.setdefault(view, ViewStats())
+            stats.requests += 1
+            stats.queries.observe(recorder.count)
+            stats.db_time.observe(recorder.duration)
+            stats.duplicates += recorder.duplicates
+            stats.over_budget += over_budget
+            if recorder.slowest[0] > stats.slowest[0]:
+                stats.slowest = (recorder.slowest[0], fingerprint(recorder.slowest[1]))
+
+    def snapshot(self):
+        with self.lock:
+            return {view: stats.as_dict() for view, stats in sorted(self.views.items())}
+
+    def clear(self):
+        with self.lock:
+            self.views.clear()
+
+
+store = SQLStatsStore()
+
+
+def view_name(request):
+    """``ProductViewSet.list``, ``LoginView.post`` or a function view's name."""
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return None
+    func = match.func
+    cls = getattr(func, "cls", None) or getattr(func, "view_class", None)
+    if cls is None:
+        return getattr(func, "__name__", match.view_name)
+    method = request.method.lower()
+    action = (getattr(func, "actions", None) or {}).get(method, method)
+    return f"{cls.__name__}.{action}"
+
+
+def get_budget(view):
+    # Per-view limits override the '*' defaults key by key
+    budgets = getattr(settings, "SQL_QUERY_BUDGETS", {})
+    return {**budgets.get("*", {}), **budgets.get(view, {})}
+
+
+class QueryInstrumentationMiddleware:
+    """
+    Counts and times the SQL of every request, grouped by resolved view.
+
+    Aggregates go to ``store`` (served by SQLMetricsView). With
+    ``SQL_INSTRUMENTATION_HEADERS`` on (staging), each response also carries
+    ``X-DB-*`` headers. Crossing a ``SQL_QUERY_BUDGETS`` entry logs a
+    warning. Sync and async capable, so ASGI requests to async views are
+    not adapted through a thread just for this middleware.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not getattr(settings, "SQL_INSTRUMENTATION", True):
+            return self.get_response(request)
+
+        recorder = QueryRecorder()
+        with self.instrument(recorder):
+            response = self.get_response(request)
+        return self.finish(request, recorder, response)
+
+    async def __acall__(self, request):
+        if not getattr(settings, "SQL_INSTRUMENTATION", True):
+            return await self.get_response(request)
+
+        recorder = QueryRecorder()
+        with self.instrument(recorder):
+            response = await self.get_response(request)
+        return self.finish(request, recorder, response)
+
+    @contextmanager
+    def instrument(self, recorder):
+        # connections is context-local, so sync_to_async DB work of this
+        # request sees the same wrapped connection objects
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+            yield
+
+    def finish(self, request, recorder, response):
+        # Picked up by core.metrics.PrometheusMiddleware
+        request.db_time_ms = recorder.duration
+        view = view_name(request)
+        if view is None:
+            return response
+
+        over_budget = self.check_budget(view, recorder)
+        store.record(view, recorder, over_budget)
+        if getattr(settings, "SQL_INSTRUMENTATION_HEADERS", False):
+            response["X-DB-Query-Count"] = str(recorder.count)
+            response["X-DB-Time-Ms"] = f"{recorder.duration:.2f}"
+            response["X-DB-Duplicate-Queries"] = str(recorder.duplicates)
+            if recorder.slowest[1]:
+                ms, sql = recorder.slowest
+                response["X-DB-Slowest"] = f"{fingerprint_id(fingerprint(sql))}; {ms:.2f}ms"
+        return response
+
+    def check_budget(self, view, recorder):
+        budget = get_budget(view)
+        if not budget:
+            return False
+        problems = []
+        if "queries" in budget and recorder.count > budget["queries"]:
+            problems.append(f"{recorder.count} queries > {budget['queries']}")
+        if "db_ms" in budget and recorder.duration > budget["db_ms"]:
+            problems.append(f"{recorder.duration:.1f}ms DB time > {budget['db_ms']}ms")
+        if "duplicates" in budget and recorder.duplicates > budget["duplicates"]:
+            problems.append(f"{recorder.duplicates} duplicate queries > {budget['duplicates']}")
+        if problems:
+            logger.warning(
+                "SQL budget exceeded for %s: %s (slowest: %s)",
+                view, "; ".join(problems), fingerprint(recorder.slowest[1])[:200],
+            )
+        return bool(problems)
+
+
+class SQLMetricsView(APIView):
+    """Per-view SQL histograms for this worker process (staff only)."""
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(store.snapshot())
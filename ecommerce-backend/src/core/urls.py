@@ -122,3 +122,21 @@ urlpatterns += [
         name="swagger-ui",
     ),
 ]
+
+from categories.async_views import category_list
+from products.async_views import product_detail, product_list
+
+# Async read path (run under uvicorn workers, see core/asgi.py)
+urlpatterns += [
+    path("api/async/products/", product_list, name="async-product-list"),
+    path("api/async/products/<int:pk>/", product_detail, name="async-product-detail"),
+    path("api/async/categories/", category_list, name="async-category-list"),
+]
+
+from core.metrics import metrics_view
+from core.sqlstats import SQLMetricsView
+
+urlpatterns += [
+    path("api/metrics/sql/", SQLMetricsView.as_view(), name="sql-metrics"),
+    path("metrics", metrics_view, name="metrics"),
+]
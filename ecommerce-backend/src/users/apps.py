@@ -1,3 +1,8 @@
-docker-compose run backend python src/manage.py startapp categories
-docker-compose run backend python src/manage.py startapp products
+from django.apps import AppConfig
 
+
+class UsersConfig(AppConfig):
+    name = "users"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,166 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+
+
+SNAPSHOT_FIELDS = ("id", "email", "is_active", "is_staff", "is_superuser")
+
+
+class LRUCache:
+    """Small thread-safe LRU with per-entry expiry, local to one worker process."""
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            value, expires = item
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        expires = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class UserSnapshot:
+    """
+    Just enough of a user for the usual checks (id, email, is_active,
+    is_staff, is_superuser). Model permissions are delegated to the full
+    user row, loaded on first use; other views that need it load it themselves.
+    """
+    is_authenticated = True
+    is_anonymous = False
+
+    def __init__(self, id, email, is_active, is_staff, is_superuser=False):
+        self.id = self.pk = id
+        self.email = email
+        self.is_active = is_active
+        self.is_staff = is_staff
+        self.is_superuser = is_superuser
+        self._user = None
+
+    def __str__(self):
+        return self.email
+
+    def __eq__(self, other):
+        return getattr(other, "pk", None) == self.pk
+
+    def __hash__(self):
+        return hash(self.pk)
+
+    def get_username(self):
+        return self.email
+
+    def get_user(self):
+        if self._user is None:
+            self._user = get_user_model()._default_manager.get(pk=self.pk)
+        return self._user
+
+    def has_perm(self, perm, obj=None):
+        # Same shortcut as PermissionsMixin, without loading the row
+        if self.is_active and self.is_superuser:
+            return True
+        return self.get_user().has_perm(perm, obj)
+
+    def has_perms(self, perm_list, obj=None):
+        return all(self.has_perm(perm, obj) for perm in perm_list)
+
+    def has_module_perms(self, module):
+        if self.is_active and self.is_superuser:
+            return True
+        return self.get_user().has_module_perms(module)
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+token_cache = LRUCache(maxsize=_setting("JWT_TOKEN_CACHE_SIZE", 10_000), ttl=300)
+user_cache = LRUCache(maxsize=_setting("JWT_USER_CACHE_SIZE", 10_000), ttl=_setting("JWT_USER_LOCAL_TTL", 30))
+
+
+def snapshot_cache_key(user_id):
+    return f"user-snapshot:{user_id}"
+
+
+def invalidate_user_snapshot(user_id):
+    # Other workers' local copies expire within JWT_USER_LOCAL_TTL seconds
+    user_cache.delete(user_id)
+    cache.delete(snapshot_cache_key(user_id))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that skips the work it repeats on every request:
+    verified tokens are kept in a local LRU until they expire, and the user
+    row is replaced by a snapshot cached locally and in Redis. User signals
+    call ``invalidate_user_snapshot`` on save/delete.
+    """
+
+    def get_validated_token(self, raw_token):
+        key = hashlib.sha256(raw_token).hexdigest()
+        token = token_cache.get(key)
+        if token is not None:
+            return token
+
+        token = super().get_validated_token(raw_token)
+        remaining = token.payload.get("exp", 0) - time.time()
+        if remaining > 0:
+            token_cache.set(key, token, ttl=min(remaining, token_cache.ttl))
+        return token
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise AuthenticationFailed("Token contained no recognizable user identification")
+
+        snapshot = user_cache.get(user_id)
+        if snapshot is None:
+            snapshot = cache.get(snapshot_cache_key(user_id))
+            if snapshot is None:
+                User = get_user_model()
+                snapshot = (
+                    User.objects
+                    .filter(**{api_settings.USER_ID_FIELD: user_id})
+                    .values(*SNAPSHOT_FIELDS)
+                    .first()
+                )
+                if snapshot is None:
+                    raise AuthenticationFailed("User not found", code="user_not_found")
+                cache.set(snapshot_cache_key(user_id), snapshot, _setting("JWT_USER_CACHE_TTL", 300))
+            user_cache.set(user_id, snapshot)
+
+        if not snapshot["is_active"]:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+        return UserSnapshot(**snapshot)
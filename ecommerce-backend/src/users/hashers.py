@@ -0,0 +1,112 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher, PBKDF2PasswordHasher
+from django.http import JsonResponse
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.module_loading import import_string
+from rest_framework.exceptions import APIException
+
+
+# Hashing is deliberately slow CPU work. Running it in a small process pool
+# caps how many cores a login storm can take, and keeps it from holding the
+# GIL in the threaded (gthread, see gunicorn.conf.py) or async web workers:
+# other threads keep serving while a login waits. The pool is per web
+# worker, so the machine-wide bound is web workers x PASSWORD_HASHING_WORKERS.
+
+_pool = None
+_slots = None
+_lock = threading.Lock()
+
+
+class HashingOverloaded(APIException):
+    status_code = 503
+    default_detail = "Too many sign-in attempts right now, please retry shortly."
+    default_code = "hashing_overloaded"
+
+
+def pool_size():
+    return getattr(settings, "PASSWORD_HASHING_WORKERS", 1)
+
+
+def _get_pool():
+    global _pool, _slots
+    if _pool is None:
+        with _lock:
+            if _pool is None:
+                workers = pool_size()
+                # Spawned, not forked: forking a threaded web worker is unsafe
+                _pool = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+                # Running plus queued jobs; callers beyond that wait, then get a 503
+                queue = getattr(settings, "PASSWORD_HASHING_QUEUE", 4)
+                _slots = threading.BoundedSemaphore(workers * queue)
+    return _pool
+
+
+def shutdown_pool():
+    global _pool, _slots
+    with _lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool, _slots = None, None
+
+
+def _call_hasher(path, method, args):
+    # Runs in a pool process: the plain hasher, no settings needed
+    return getattr(import_string(path)(), method)(*args)
+
+
+class PooledHasherMixin:
+    """
+    Runs ``encode`` and ``verify`` of the wrapped hasher in the process pool.
+
+    ``algorithm`` is inherited, so stored hashes stay interchangeable with
+    the stock hasher. Set ``PASSWORD_HASHING_WORKERS = 0`` to hash inline.
+    """
+    inline_hasher = None
+
+    def _run(self, method, *args):
+        if pool_size() == 0:
+            return getattr(super(), method)(*args)
+
+        pool = _get_pool()
+        timeout = getattr(settings, "PASSWORD_HASHING_QUEUE_TIMEOUT", 5)
+        if not _slots.acquire(timeout=timeout):
+            raise HashingOverloaded()
+        try:
+            return pool.submit(_call_hasher, self.inline_hasher, method, args).result()
+        finally:
+            _slots.release()
+
+    def encode(self, password, salt, *args):
+        return self._run("encode", password, salt, *args)
+
+    def verify(self, password, encoded):
+        return self._run("verify", password, encoded)
+
+
+class PooledArgon2PasswordHasher(PooledHasherMixin, Argon2PasswordHasher):
+    inline_hasher = "django.contrib.auth.hashers.Argon2PasswordHasher"
+
+
+class PooledPBKDF2PasswordHasher(PooledHasherMixin, PBKDF2PasswordHasher):
+    inline_hasher = "django.contrib.auth.hashers.PBKDF2PasswordHasher"
+
+
+class HashingOverloadedMiddleware(MiddlewareMixin):
+    """
+    Turns ``HashingOverloaded`` into a 503 outside DRF too (admin login or
+    any plain Django view calling ``authenticate``), instead of a 500.
+    DRF views already render it themselves.
+    """
+
+    def process_exception(self, request, exception):
+        if isinstance(exception, HashingOverloaded):
+            return JsonResponse(
+                {"detail": str(exception.detail)},
+                status=exception.status_code,
+                headers={"Retry-After": "1"},
+            )
+        return None
@@ -0,0 +1,47 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth.hashers import Argon2PasswordHasher, PBKDF2PasswordHasher
+from django.core.management.base import BaseCommand
+from users.hashers import PooledArgon2PasswordHasher, PooledPBKDF2PasswordHasher, pool_size
+
+PASSWORD = "correct horse battery staple"
+
+
+class Command(BaseCommand):
+    help = "Reports password verifications (logins) per second per core, inline vs the hashing pool"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--logins", type=int, default=200)
+        parser.add_argument("--concurrency", type=int, default=None,
+                            help="Concurrent logins; defaults to the hashing pool size")
+
+    def handle(self, *args, **options):
+        workers = pool_size() or 1
+        concurrency = options["concurrency"] or workers
+        scenarios = [
+            # (label, hasher, cores it can use)
+            ("pbkdf2 on request thread (before)", PBKDF2PasswordHasher(), 1),
+            ("argon2 on request thread", Argon2PasswordHasher(), 1),
+            ("pbkdf2 in pool", PooledPBKDF2PasswordHasher(), workers),
+            ("argon2 in pool (after)", PooledArgon2PasswordHasher(), workers),
+        ]
+        for label, hasher, cores in scenarios:
+            report = self.run(hasher, options["logins"], concurrency if cores > 1 else 1)
+            report["logins_per_second_per_core"] = round(report["logins_per_second"] / cores, 1)
+            self.stdout.write(f"{label}: {json.dumps(report)}")
+
+    def run(self, hasher, logins, concurrency):
+        encoded = hasher.encode(PASSWORD, hasher.salt())
+        hasher.verify(PASSWORD, encoded)  # warm up the pool
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as threads:
+            results = list(threads.map(lambda _: hasher.verify(PASSWORD, encoded), range(logins)))
+        elapsed = time.perf_counter() - started
+        return {
+            "logins_per_second": round(logins / elapsed, 1),
+            "ms_per_login": round(elapsed / logins * 1000 * concurrency, 2),
+            "failures": results.count(False),
+        }
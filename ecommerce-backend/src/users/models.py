@@ -85,6 +85,26 @@ class User(AbstractUser):
         return self.email
 
 
+class Profile(models.Model):
+    # Created by users.tasks after sign-up, off the request path
+    user = models.OneToOneField("users.User", related_name="profile", on_delete=models.CASCADE)
+    welcome_email_sent_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # The welcome-email batch only ever scans unsent profiles
+            models.Index(
+                fields=["created_at"],
+                condition=models.Q(welcome_email_sent_at__isnull=True),
+                name="profile_welcome_pending_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"Profile of {self.user_id}"
+
+
 docker-compose run backend python src/manage.py startapp categories
 docker-compose run backend python src/manage.py startapp products
 
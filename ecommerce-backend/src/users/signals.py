@@ -0,0 +1,15 @@
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .authentication import invalidate_user_snapshot
+
+
+@receiver([post_save, post_delete], sender=get_user_model())
+def invalidate_cached_user(sender, instance, **kwargs):
+    # Deactivation, staff changes and email changes must reach the JWT cache.
+    # After commit: deleting earlier lets a concurrent request re-cache the
+    # old row for the full TTL. The pk is read now, delete() clears it.
+    user_id = instance.pk
+    transaction.on_commit(lambda: invalidate_user_snapshot(user_id))
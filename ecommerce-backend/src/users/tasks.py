@@ -0,0 +1,85 @@
+import smtplib
+
+from celery import shared_task
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Profile
+
+
+DEFAULT_WELCOME_EMAIL_BATCH_SIZE = 100
+
+
+@shared_task(
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_backoff_max=300,
+    retry_jitter=True,
+    max_retries=5,
+)
+def handle_registration(user_id):
+    """
+    Post-sign-up work kept off the request path. Idempotent, so retries are
+    safe. The welcome email itself is sent by ``send_welcome_emails``.
+    """
+    Profile.objects.get_or_create(user_id=user_id)
+
+
+def build_welcome_email(user):
+    name = user.first_name or user.email
+    return EmailMessage(
+        subject="Welcome to Nexus",
+        body=f"Hi {name},\n\nThanks for signing up. Your account is ready to use.\n",
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[user.email],
+    )
+
+
+@shared_task(
+    autoretry_for=(smtplib.SMTPException, OSError),
+    retry_backoff=True,
+    retry_backoff_max=600,
+    retry_jitter=True,
+    max_retries=8,
+)
+def send_welcome_emails(batch_size=None):
+    """
+    Send every pending welcome email in batches over a single SMTP
+    connection, instead of opening one connection per message.
+
+    Pending profiles are claimed with SKIP LOCKED, so overlapping runs never
+    send the same email twice. Each message counts as sent once the server
+    has accepted it: on an SMTP failure the messages already accepted are
+    still committed as sent, and the task retries the rest with exponential
+    backoff.
+    """
+    batch_size = batch_size or getattr(settings, "WELCOME_EMAIL_BATCH_SIZE", DEFAULT_WELCOME_EMAIL_BATCH_SIZE)
+    sent = 0
+    with get_connection() as connection:
+        while True:
+            failure = None
+            with transaction.atomic():
+                batch = list(
+                    Profile.objects
+                    .filter(welcome_email_sent_at__isnull=True)
+                    .select_related("user")
+                    .select_for_update(skip_locked=True, of=("self",))
+                    .order_by("created_at")[:batch_size]
+                )
+                if not batch:
+                    return sent
+                accepted = []
+                for profile in batch:
+                    try:
+                        connection.send_messages([build_welcome_email(profile.user)])
+                    except (smtplib.SMTPException, OSError) as exc:
+                        # Raising here would roll back the accepted ones too
+                        failure = exc
+                        break
+                    accepted.append(profile.pk)
+                Profile.objects.filter(pk__in=accepted).update(welcome_email_sent_at=timezone.now())
+            sent += len(accepted)
+            if failure is not None:
+                raise failure
@@ -0,0 +1,188 @@
+import hashlib
+import logging
+import threading
+import time
+
+from django.conf import settings
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+from .authentication import LRUCache
+
+
+logger = logging.getLogger(__name__)
+
+# Refill, then take ``want`` tokens while the bucket is at least half full
+# (the caller keeps the extra ones as a local lease), else 1, else none.
+# One round trip, atomic across every web worker.
+TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local want = tonumber(ARGV[3])
+local now = redis.call('TIME')
+now = tonumber(now[1]) + tonumber(now[2]) / 1000000
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + (now - ts) * rate)
+
+local granted = 0
+if tokens >= capacity / 2 and tokens >= want then
+    granted = want
+elseif tokens >= 1 then
+    granted = 1
+end
+tokens = tokens - granted
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000) + 1000)
+if granted > 0 then
+    return {granted, 0}
+end
+return {0, math.ceil((1 - tokens) / rate * 1000)}
+"""
+
+
+class RedisBucketStore:
+    def __init__(self, url):
+        import redis
+
+        self.client = redis.Redis.from_url(url, socket_timeout=0.2, socket_connect_timeout=0.2)
+        self.script = self.client.register_script(TOKEN_BUCKET_LUA)
+
+    def take(self, key, capacity, rate, want):
+        granted, wait_ms = self.script(keys=[key], args=[capacity, rate, want])
+        return int(granted), int(wait_ms) / 1000
+
+
+class LocalBucketStore:
+    """Same algorithm in process memory: development and tests, no Redis."""
+
+    def __init__(self):
+        self.buckets = LRUCache(maxsize=100_000, ttl=3600)
+        self.lock = threading.Lock()
+
+    def take(self, key, capacity, rate, want):
+        now = time.monotonic()
+        with self.lock:
+            tokens, ts = self.buckets.get(key) or (capacity, now)
+            tokens = min(capacity, tokens + (now - ts) * rate)
+            if tokens >= capacity / 2 and tokens >= want:
+                granted = want
+            elif tokens >= 1:
+                granted = 1
+            else:
+                granted = 0
+            tokens -= granted
+            self.buckets.set(key, (tokens, now))
+        return granted, 0 if granted else (1 - tokens) / rate
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_bucket_store():
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                url = getattr(settings, "THROTTLE_REDIS_URL", None)
+                _store = RedisBucketStore(url) if url else LocalBucketStore()
+    return _store
+
+
+# Tokens already taken from Redis in a batch, spent locally without a round trip
+leases = LRUCache(maxsize=50_000, ttl=5)
+_lease_lock = threading.Lock()
+
+
+def _spend_lease(key):
+    with _lease_lock:
+        remaining = leases.get(key)
+        if not remaining:
+            return False
+        leases.set(key, remaining - 1)
+        return True
+
+
+def parse_rate(rate):
+    # "20/min" -> (20, 60), as DRF reads DEFAULT_THROTTLE_RATES
+    num, period = rate.split("/")
+    return int(num), {"s": 1, "m": 60, "h": 3600, "d": 86400}[period[0]]
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Token bucket throttle, shared by all workers through Redis.
+
+    The rate comes from ``DEFAULT_THROTTLE_RATES[<view.throttle_scope><scope_suffix>]``
+    in DRF's usual "20/min" form: the bucket holds 20 tokens and refills at
+    20 per minute. A client well under its limit is granted a small batch of
+    tokens per round trip (``THROTTLE_LEASE_FRACTION`` of the bucket), which
+    this process spends locally, so healthy traffic rarely touches Redis.
+    Leases only ever make the limit stricter, never looser. If Redis is
+    unreachable the throttle fails open.
+    """
+    scope_suffix = ""
+
+    def __init__(self):
+        self.wait_seconds = None
+
+    def get_ident_key(self, request):
+        raise NotImplementedError
+
+    def get_rate(self, view):
+        scope = getattr(view, "throttle_scope", None)
+        if not scope:
+            return None, None
+        scope += self.scope_suffix
+        return scope, api_settings.DEFAULT_THROTTLE_RATES.get(scope)
+
+    def allow_request(self, request, view):
+        scope, rate = self.get_rate(view)
+        ident = self.get_ident_key(request)
+        if rate is None or ident is None:
+            return True
+
+        capacity, period = parse_rate(rate)
+        key = f"throttle:{scope}:{ident}"
+        if _spend_lease(key):
+            return True
+
+        fraction = getattr(settings, "THROTTLE_LEASE_FRACTION", 0.1)
+        want = max(int(capacity * fraction), 1)
+        try:
+            granted, wait = get_bucket_store().take(key, capacity, capacity / period, want)
+        except Exception:
+            logger.warning("Throttle store unavailable, allowing request", exc_info=True)
+            return True
+
+        if granted == 0:
+            self.wait_seconds = wait
+            return False
+        if granted > 1:
+            with _lease_lock:
+                leases.set(key, (leases.get(key) or 0) + granted - 1)
+        return True
+
+    def wait(self):
+        return self.wait_seconds
+
+
+class IPTokenBucketThrottle(TokenBucketThrottle):
+    def get_ident_key(self, request):
+        return self.get_ident(request)
+
+
+class EmailTokenBucketThrottle(TokenBucketThrottle):
+    """Per account, so one email can't be brute-forced from many IPs."""
+    scope_suffix = "_email"
+
+    def get_ident_key(self, request):
+        email = request.data.get("email") if hasattr(request.data, "get") else None
+        if not isinstance(email, str) or not email.strip():
+            return None
+        # Hashed: no addresses in Redis keys
+        return hashlib.sha1(email.strip().lower().encode()).hexdigest()
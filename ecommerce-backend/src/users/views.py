@@ -1,17 +1,24 @@
+from django.db import transaction
 from rest_framework import status, generics
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
-from rest_framework_simplejwt.views import TokenObtainPairView
+from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView as BaseTokenRefreshView
 from .serializers import UserRegistrationSerializer
+from .tasks import handle_registration
+from .throttling import EmailTokenBucketThrottle, IPTokenBucketThrottle
 
 class RegisterView(generics.CreateAPIView):
     serializer_class = UserRegistrationSerializer
     permission_classes = [AllowAny] # Open to everyone
+    throttle_classes = [IPTokenBucketThrottle]
+    throttle_scope = "register"
 
     def post(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         if serializer.is_valid():
             user = serializer.save()
+            # Profile and welcome email run on Celery once the user row is committed
+            transaction.on_commit(lambda: handle_registration.delay(user.id))
             return Response({
                 "message": "User registered successfully",
                 "user": {
@@ -24,6 +31,13 @@ class RegisterView(generics.CreateAPIView):
 # We use the built-in SimpleJWT Login View
 class LoginView(TokenObtainPairView):
     permission_classes = [AllowAny]
+    throttle_classes = [IPTokenBucketThrottle, EmailTokenBucketThrottle]
+    throttle_scope = "login"
+
+
+class TokenRefreshView(BaseTokenRefreshView):
+    throttle_classes = [IPTokenBucketThrottle]
+    throttle_scope = "token_refresh"
 
 
 docker-compose run backend python src/manage.py makemigrations